@@ -1,7 +1,19 @@
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+from typing import Literal
 from fastapi.middleware.cors import CORSMiddleware
-import random, uuid, datetime, re
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.concurrency import run_in_threadpool
+import asyncio, copy, random, uuid, datetime, re, base64, csv, io, os, sys, json, time, argparse, threading, multiprocessing, sqlite3, struct, hashlib, weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import OrderedDict, deque
+from bisect import bisect_left
+from itertools import product
 from datetime import timedelta
+import numpy as np
+import orjson
+from sortedcontainers import SortedList
 
 app = FastAPI(title="ApexScore API")
 
@@ -13,6 +25,207 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Responses of at least APEXSCORE_GZIP_MIN_BYTES are gzipped for clients that accept it. Level 6
+# keeps most of level 9's ratio on this repetitive JSON at a fraction of the CPU.
+GZIP_MIN_BYTES = int(os.environ.get("APEXSCORE_GZIP_MIN_BYTES", "1024"))
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_BYTES, compresslevel=6)
+
+# Metrics. stage() times a named step of request handling; MetricsMiddleware records per-route
+# latency. Everything is exported in Prometheus text format at /metrics. Setting
+# APEXSCORE_PROFILE_SLOW_MS starts a sampling profiler: all thread stacks are sampled every
+# APEXSCORE_PROFILE_INTERVAL_MS into a ring buffer, and each request slower than the threshold has
+# the samples from its time window written to APEXSCORE_PROFILE_DIR as folded stacks, the input
+# format of flamegraph.pl and speedscope. Samples cover every thread, not only the slow request.
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_LOCK = threading.Lock()
+STAGE_HISTOGRAMS = {}
+ROUTE_HISTOGRAMS = {}
+RESPONSE_COUNTS = {}
+CACHE_COUNTS = {"report": [0, 0], "loan_summary": [0, 0]}
+GENERATION_JOBS = {"running": 0, "rejected": 0}
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+def observe(histograms, key, seconds):
+    with METRICS_LOCK:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram()
+        histogram.observe(seconds)
+
+def count_cache(cache, hit):
+    with METRICS_LOCK:
+        CACHE_COUNTS[cache][0 if hit else 1] += 1
+
+def in_worker_process():
+    """True in a bulk pool worker, including while it imports modules before its first task.
+
+    Spawned and forkserver children import the parent's main module during preparation, before
+    parent_process() is set, but they are already renamed from "MainProcess" by then.
+    """
+    return multiprocessing.parent_process() is not None or multiprocessing.current_process().name != "MainProcess"
+
+class stage:
+    """Context manager timing one named stage into apexscore_stage_seconds.
+
+    A no-op in pool worker processes: their timings never reach /metrics, and generation there
+    must not take METRICS_LOCK.
+    """
+    __slots__ = ("name", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = None if in_worker_process() else time.perf_counter()
+
+    def __exit__(self, *exc):
+        if self.started is not None:
+            observe(STAGE_HISTOGRAMS, self.name, time.perf_counter() - self.started)
+
+PROFILE_SLOW_MS = float(os.environ.get("APEXSCORE_PROFILE_SLOW_MS", "0"))
+PROFILE_INTERVAL = float(os.environ.get("APEXSCORE_PROFILE_INTERVAL_MS", "5")) / 1000
+PROFILE_DIR = os.environ.get("APEXSCORE_PROFILE_DIR", "profiles")
+PROFILE_SAMPLES = deque(maxlen=int(os.environ.get("APEXSCORE_PROFILE_BUFFER", "20000")))
+# Dumps scan the whole buffer and write a file, so they run one at a time on their own thread
+# rather than on the event loop of a request that is already slow
+PROFILE_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="apexscore-profile")
+
+def _collapse(frame):
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+def _sample_stacks():
+    me = threading.get_ident()
+    while True:
+        now = time.perf_counter()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id != me:
+                PROFILE_SAMPLES.append((now, _collapse(frame)))
+        time.sleep(PROFILE_INTERVAL)
+
+def dump_profile(route, started, finished):
+    folded = {}
+    for at, stack in list(PROFILE_SAMPLES):
+        if started <= at <= finished:
+            folded[stack] = folded.get(stack, 0) + 1
+    if not folded:
+        return None
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    name = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+    path = os.path.join(PROFILE_DIR, f"{int(time.time() * 1000)}-{name}-{int((finished - started) * 1000)}ms.folded")
+    with open(path, "w") as f:
+        f.writelines(f"{stack} {count}\n" for stack, count in folded.items())
+    return path
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency to the last body byte, labelled by route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        started = time.perf_counter()
+        status = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            finished = time.perf_counter()
+            route = getattr(scope.get("route"), "path", "unmatched")
+            observe(ROUTE_HISTOGRAMS, (scope["method"], route), finished - started)
+            with METRICS_LOCK:
+                key = (scope["method"], route, status[0])
+                RESPONSE_COUNTS[key] = RESPONSE_COUNTS.get(key, 0) + 1
+            if PROFILE_SLOW_MS and (finished - started) * 1000 >= PROFILE_SLOW_MS:
+                PROFILE_WRITER.submit(dump_profile, route, started, finished)
+
+def _labels(**labels):
+    return "{" + ",".join(f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"' for k, v in labels.items()) + "}"
+
+def _render_histograms(lines, metric, help_text, histograms, label_names):
+    lines.append(f"# HELP {metric} {help_text}")
+    lines.append(f"# TYPE {metric} histogram")
+    for key, histogram in sorted(histograms.items()):
+        labels = dict(zip(label_names, key if isinstance(key, tuple) else (key,)))
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), histogram.counts):
+            cumulative += count
+            lines.append(f"{metric}_bucket{_labels(**labels, le=bound)} {cumulative}")
+        lines.append(f"{metric}_sum{_labels(**labels)} {histogram.sum}")
+        lines.append(f"{metric}_count{_labels(**labels)} {histogram.count}")
+
+def render_metrics(store_size):
+    with METRICS_LOCK:
+        stages = {k: _copy_histogram(h) for k, h in STAGE_HISTOGRAMS.items()}
+        routes = {k: _copy_histogram(h) for k, h in ROUTE_HISTOGRAMS.items()}
+        responses = dict(RESPONSE_COUNTS)
+        caches = {k: list(v) for k, v in CACHE_COUNTS.items()}
+        jobs = dict(GENERATION_JOBS)
+    lines = []
+    _render_histograms(lines, "apexscore_request_seconds", "Request latency by route.", routes, ("method", "route"))
+    lines.append("# HELP apexscore_responses_total Responses by route and status.")
+    lines.append("# TYPE apexscore_responses_total counter")
+    for (method, route, status), count in sorted(responses.items()):
+        lines.append(f"apexscore_responses_total{_labels(method=method, route=route, status=status)} {count}")
+    _render_histograms(lines, "apexscore_stage_seconds", "Time spent in named processing stages.", stages, ("stage",))
+    lines.append("# HELP apexscore_cache_requests_total Cache lookups by cache and result.")
+    lines.append("# TYPE apexscore_cache_requests_total counter")
+    for cache, (hits, misses) in sorted(caches.items()):
+        lines.append(f"apexscore_cache_requests_total{_labels(cache=cache, result='hit')} {hits}")
+        lines.append(f"apexscore_cache_requests_total{_labels(cache=cache, result='miss')} {misses}")
+    lines.append("# HELP apexscore_cache_hit_ratio Share of cache lookups that hit.")
+    lines.append("# TYPE apexscore_cache_hit_ratio gauge")
+    for cache, (hits, misses) in sorted(caches.items()):
+        lines.append(f"apexscore_cache_hit_ratio{_labels(cache=cache)} {hits / (hits + misses) if hits + misses else 0}")
+    lines.append("# HELP apexscore_store_applicants Applicants in the store.")
+    lines.append("# TYPE apexscore_store_applicants gauge")
+    lines.append(f"apexscore_store_applicants {store_size}")
+    lines.append("# HELP apexscore_report_cache_entries Pre-serialized report views held in memory.")
+    lines.append("# TYPE apexscore_report_cache_entries gauge")
+    lines.append(f"apexscore_report_cache_entries {len(REPORT_CACHE)}")
+    lines.append("# HELP apexscore_generation_jobs Generation jobs queued or running.")
+    lines.append("# TYPE apexscore_generation_jobs gauge")
+    lines.append(f"apexscore_generation_jobs {jobs['running']}")
+    lines.append("# HELP apexscore_generation_rejected_total Generation jobs refused with a 503.")
+    lines.append("# TYPE apexscore_generation_rejected_total counter")
+    lines.append(f"apexscore_generation_rejected_total {jobs['rejected']}")
+    return "\n".join(lines) + "\n"
+
+def _copy_histogram(histogram):
+    copy = Histogram()
+    copy.counts = list(histogram.counts)
+    copy.sum = histogram.sum
+    copy.count = histogram.count
+    return copy
+
+app.add_middleware(MetricsMiddleware)
+
+if PROFILE_SLOW_MS and not in_worker_process():
+    threading.Thread(target=_sample_stacks, name="apexscore-profiler", daemon=True).start()
+
 COUNTRIES = {
     "Nigeria": {"code": "+234", "currency": "NGN", "symbol": "₦", "banks": ["GTBank", "Access Bank", "First Bank", "Sterling Bank", "UBA", "Opay", "Moniepoint MFB", "PalmPay", "Kuda", "FairMoney"], "isps": ["MTN", "Airtel", "Glo", "9mobile"], "cities": ["Lagos", "Ibadan", "Abeokuta", "Benin City", "Onitsha"], "android_models": ["Tecno Spark", "Infinix Hot", "Samsung A14", "Xiaomi Redmi"], "ios_models": ["iPhone 11", "iPhone 12", "iPhone SE"]},
     "USA": {"code": "+1", "currency": "USD", "symbol": "$", "banks": ["Chase", "Bank of America", "Wells Fargo", "Capital One"], "isps": ["Verizon", "AT&T", "T-Mobile"], "cities": ["New York", "Houston", "Chicago", "Dallas", "Los Angeles"], "android_models": ["Samsung Galaxy S21", "Google Pixel", "OnePlus"], "ios_models": ["iPhone 13", "iPhone 14", "iPhone 12"]},
@@ -32,7 +245,609 @@ CREDIT_BUREAUS = ["Experian", "Equifax", "TransUnion", "FICO", "Credit Registry"
 INCOME_SOURCES = ["Employer Payroll", "Bank Statement Analysis", "Tax Records", "Self-Reported", "Business Revenue"]
 EXPENDITURE_CATEGORIES = ["Housing", "Transportation", "Food & Groceries", "Utilities", "Healthcare", "Entertainment", "Debt Repayment", "Savings", "Other"]
 
-DATABASE = {}
+# Storage backends. APEXSCORE_STORE selects one:
+#   memory - plain dicts in this process (default)
+#   compact - like memory, but records are held packed (see CompactApplicant) to cut bytes per record
+#   sqlite - a SQLite file in WAL mode at APEXSCORE_DB_PATH, shared by every worker pointed at it
+# Each keeps insertion order, a lowercased-email index (first applicant wins, like the old scan),
+# the flat counters behind /api/stats and the indexes behind query(), all updated in the same
+# step as the record itself.
+SCORE_BUCKET_WIDTH = 10
+SCORE_BUCKETS = 100 // SCORE_BUCKET_WIDTH
+
+def normalize_email(email):
+    return email.lower()
+
+def _stats_key(applicant):
+    return (applicant["apex_score"], applicant["risk_level"], applicant["location"]["country"],
+            applicant["action_recommendation"]["decision"])
+
+def _stats_deltas(applicant):
+    return _stats_key_deltas(_stats_key(applicant))
+
+def _stats_key_deltas(key):
+    score, risk_level, country, decision = key
+    return [
+        ("total", 1),
+        ("score_sum", score),
+        (f"risk:{risk_level}", 1),
+        (f"hist:{min(score // SCORE_BUCKET_WIDTH, SCORE_BUCKETS - 1)}", 1),
+        (f"country:{country}", 1),
+        (f"decision:{decision}", 1),
+    ]
+
+QUERY_SORTS = ("apex_score", "created_at")
+
+def _query_key(applicant):
+    return (applicant["risk_level"], applicant["location"]["country"],
+            applicant["action_recommendation"]["decision"], applicant["apex_score"], applicant["created_at"])
+
+class MemoryStore:
+    # Reads are plain dict lookups, safe to run on the event loop
+    blocking = False
+
+    def __init__(self):
+        self.records = {}
+        self.order = []
+        self.email_index = {}
+        # Later holders of an indexed email and each record's indexed key, so a replace that
+        # changes the email can hand the old key to the next holder, as SQLite's ORDER BY seq does
+        self.email_dupes = {}
+        self.email_keys = {}
+        self.counters = {}
+        # _stats_key() of each record as counted, so in-place edits can be backed out
+        self.counted = {}
+        # (risk_level, country, decision) with None as a wildcard -> SortedList of keys for each sort:
+        # (apex_score, id) and (created_at, id, apex_score). Every record sits in all 8 buckets it
+        # matches, so any equality filter combination is one bucket plus a bisect.
+        self.query_index = {}
+        self.indexed = {}
+        self.seed_claimed = False
+        # Write counter and the version of each record replaced since creation (absent means 0)
+        self.instance = uuid.uuid4().hex
+        self.write_version = 0
+        self.versions = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, applicant_id):
+        return applicant_id in self.records
+
+    # Hooks for how records are held in memory; the plain store keeps the dicts themselves
+    def _dump(self, applicant):
+        return applicant
+
+    def _load(self, record):
+        return record
+
+    def get(self, applicant_id):
+        record = self.records.get(applicant_id)
+        return self._load(record) if record is not None else None
+
+    def get_versioned(self, applicant_id):
+        """A record and its write version, read together; (None, None) if it does not exist."""
+        record = self.records.get(applicant_id)
+        if record is None:
+            return None, None
+        return self._load(record), self.versions.get(applicant_id, 0)
+
+    def id_for_email(self, email_key):
+        return self.email_index.get(email_key)
+
+    def version(self, applicant_id):
+        """Write version of a record, or None if it does not exist."""
+        if applicant_id not in self.records:
+            return None
+        return self.versions.get(applicant_id, 0)
+
+    def store_version(self):
+        return self.write_version
+
+    def save(self, applicant):
+        """Insert or replace a record; returns the replaced record (or None) and the new version."""
+        applicant_id = applicant["id"]
+        previous = self.records.get(applicant_id)
+        self.write_version += 1
+        version = self.write_version if previous is not None else 0
+        if previous is not None:
+            self.versions[applicant_id] = version
+            self._count(_stats_key_deltas(self.counted[applicant_id]), -1)
+            previous = self._load(previous)
+        self.records[applicant_id] = self._dump(applicant)
+        email_key = normalize_email(applicant["email"])
+        if self.email_keys.get(applicant_id) != email_key:
+            if applicant_id in self.email_keys:
+                self._unindex_email(applicant_id, self.email_keys[applicant_id])
+            self._index_email(applicant_id, email_key, previous is not None)
+            self.email_keys[applicant_id] = email_key
+        self.counted[applicant_id] = key = _stats_key(applicant)
+        self._count(_stats_key_deltas(key), 1)
+        query_key = _query_key(applicant)
+        if self.indexed.get(applicant_id) != query_key:
+            if applicant_id in self.indexed:
+                self._index(applicant_id, self.indexed[applicant_id], remove=True)
+            self._index(applicant_id, query_key)
+            self.indexed[applicant_id] = query_key
+        # Last, so readers walking `order` (page, values) never see an id before its record
+        if previous is None:
+            self.order.append(applicant_id)
+        return previous, version
+
+    def _index_email(self, applicant_id, email_key, replacing=False):
+        first = self.email_index.setdefault(email_key, applicant_id)
+        if first == applicant_id:
+            return
+        # Only a replace can index an older record behind a newer one; positions are looked up
+        # just for these rare collisions
+        if replacing and self.order.index(applicant_id) < self.order.index(first):
+            self.email_index[email_key], applicant_id = applicant_id, first
+        self.email_dupes.setdefault(email_key, []).append(applicant_id)
+
+    def _unindex_email(self, applicant_id, email_key):
+        dupes = self.email_dupes.get(email_key)
+        if self.email_index.get(email_key) == applicant_id:
+            if dupes:
+                successor = min(dupes, key=self.order.index)
+                dupes.remove(successor)
+                self.email_index[email_key] = successor
+            else:
+                del self.email_index[email_key]
+        elif dupes and applicant_id in dupes:
+            dupes.remove(applicant_id)
+        if dupes is not None and not dupes:
+            del self.email_dupes[email_key]
+
+    def _index(self, applicant_id, query_key, remove=False):
+        risk_level, country, decision, score, created_at = query_key
+        entries = {"apex_score": (score, applicant_id), "created_at": (created_at, applicant_id, score)}
+        for bucket in product((risk_level, None), (country, None), (decision, None)):
+            sorted_keys = self.query_index.setdefault(bucket, {sort: SortedList() for sort in QUERY_SORTS})
+            for sort, entry in entries.items():
+                if remove:
+                    sorted_keys[sort].remove(entry)
+                else:
+                    sorted_keys[sort].add(entry)
+
+    def query(self, risk_level=None, country=None, decision=None, min_score=None, max_score=None,
+              sort="apex_score", descending=False, after=None, limit=50):
+        """Filtered, sorted page; `after` is the last key of the previous page (keyset paging)."""
+        sorted_keys = self.query_index.get((risk_level, country, decision))
+        if not sorted_keys or limit == 0:
+            return [], None
+        keys = sorted_keys[sort]
+        lo, hi = 0, len(keys)
+        if sort == "apex_score":
+            if min_score is not None:
+                lo = keys.bisect_left((min_score,))
+            if max_score is not None:
+                hi = keys.bisect_left((max_score + 1,))
+        if descending:
+            end = min(hi, keys.bisect_left(after)) if after is not None else hi
+            window = keys.islice(lo, end, reverse=True)
+        else:
+            start = lo
+            if after is not None:
+                # created_at keys carry the score as a third item, so step past an exact match
+                start = keys.bisect_right(after)
+                if start < len(keys) and keys[start][:2] == tuple(after):
+                    start += 1
+                start = max(lo, start)
+            window = keys.islice(start, hi)
+        page = []
+        # Sorting by created_at with a score range has no combined index; it skips out-of-range keys
+        for key in window:
+            score = key[0] if sort == "apex_score" else key[2]
+            if (min_score is not None and score < min_score) or (max_score is not None and score > max_score):
+                continue
+            if len(page) == limit:
+                return [self._load(self.records[k[1]]) for k in page], page[-1][:2]
+            page.append(key)
+        return [self._load(self.records[k[1]]) for k in page], None
+
+    def _count(self, deltas, sign):
+        for key, amount in deltas:
+            self.counters[key] = self.counters.get(key, 0) + sign * amount
+
+    def page(self, after, limit):
+        ids = self.order[after:after + limit]
+        end = after + len(ids)
+        return [self._load(self.records[i]) for i in ids], end if end < len(self.order) else None
+
+    def values(self):
+        for applicant_id in self.order[:]:
+            yield self._load(self.records[applicant_id])
+
+    def stats_counters(self):
+        return dict(self.counters)
+
+    def claim_seeding(self):
+        """True for the one caller that should seed the store: it is empty and unclaimed."""
+        claimed, self.seed_claimed = self.seed_claimed, True
+        return not claimed and not self.records
+
+# Compact in-memory form used by CompactStore. Every nested dict becomes a tuple whose first item
+# is its key tuple, shared by all records with the same shape; enum-like strings are swapped for
+# the constant objects defined above. The loan history is one bytes blob of fixed-width rows with
+# institution, purpose and status stored as small integer codes and dates as ordinals; currency
+# comes from the enclosing tfd block. Anything that does not round-trip exactly is kept as a dict.
+BANK_NAMES = sorted({bank for c in COUNTRIES.values() for bank in c["banks"]})
+BANK_CODES = {bank: code for code, bank in enumerate(BANK_NAMES)}
+PURPOSE_CODES = {purpose: code for code, purpose in enumerate(LOAN_PURPOSES)}
+LOAN_KEYS = ["loan_id", "institution", "amount", "currency", "currency_symbol", "purpose",
+             "disbursement_date", "due_date", "status", "days_overdue", "repayment_amount"]
+LOAN_ROW = struct.Struct("<8sHBBiiiHi")
+LOAN_ID_PATTERN = re.compile(r"LN-[0-9A-F]{8}")
+_SHAPES = {}
+_VOCAB = {}
+
+def _build_vocab():
+    words = FIRST_NAMES + LAST_NAMES + MIDDLE_NAMES + JOBS + LOAN_PURPOSES + REPAYMENT_STATUS + VALID_EMAIL_DOMAINS
+    words += CREDIT_BUREAUS + INCOME_SOURCES + EXPENDITURE_CATEGORIES + list(COUNTRIES)
+    for c in COUNTRIES.values():
+        words += [c["code"], c["currency"], c["symbol"]] + c["banks"] + c["isps"] + c["cities"]
+        words += c["android_models"] + c["ios_models"]
+    words += ["Savings", "Current", "Active", "Dormant", "Android", "iOS", "VERIFIED", "UNVERIFIED",
+              "Low", "Medium", "High", "Excellent", "Good", "Fair", "Poor", "Android 13", "Android 12",
+              "Android 11", "iOS 16", "iOS 15", "iOS 17"]
+    for word in words:
+        _VOCAB.setdefault(word, word)
+
+class CompactApplicant:
+    __slots__ = ("fields", "loans")
+
+    def __init__(self, fields, loans):
+        self.fields = fields
+        self.loans = loans
+
+def _pack_value(value):
+    kind = type(value)
+    if kind is dict:
+        keys = tuple(value)
+        return (_SHAPES.setdefault(keys, keys),) + tuple(_pack_value(v) for v in value.values())
+    if kind is list:
+        return [_pack_value(v) for v in value]
+    if kind is str:
+        return _VOCAB.get(value, value)
+    return value
+
+def _unpack_value(value):
+    kind = type(value)
+    if kind is tuple:
+        return dict(zip(value[0], map(_unpack_value, value[1:])))
+    if kind is list:
+        return [_unpack_value(v) for v in value]
+    return value
+
+def _pack_loans(loans, currency, symbol):
+    rows = bytearray()
+    for loan in loans:
+        if list(loan) != LOAN_KEYS or not LOAN_ID_PATTERN.fullmatch(loan["loan_id"]):
+            return None
+        if loan["currency"] != currency or loan["currency_symbol"] != symbol:
+            return None
+        rows += LOAN_ROW.pack(
+            loan["loan_id"][3:].encode(),
+            BANK_CODES[loan["institution"]],
+            PURPOSE_CODES[loan["purpose"]],
+            STATUS_CODES[loan["status"]],
+            loan["amount"],
+            datetime.date.fromisoformat(loan["disbursement_date"]).toordinal(),
+            datetime.date.fromisoformat(loan["due_date"]).toordinal(),
+            loan["days_overdue"] or 0,
+            -1 if loan["repayment_amount"] is None else loan["repayment_amount"],
+        )
+    return bytes(rows)
+
+# ISO strings by day ordinal. Generated loan dates fall in a window of a few thousand days, so each
+# day is formatted once and the string reused instead of running strftime for every loan.
+_ISO_DATES = {}
+
+def iso_date(ordinal):
+    text = _ISO_DATES.get(ordinal)
+    if text is None:
+        text = _ISO_DATES[ordinal] = datetime.date.fromordinal(ordinal).isoformat()
+    return text
+
+def _unpack_loans(rows, currency, symbol):
+    loans = []
+    for loan_id, bank, purpose, status, amount, disbursed, due, overdue, repaid in LOAN_ROW.iter_unpack(rows):
+        loans.append({
+            "loan_id": f"LN-{loan_id.decode()}",
+            "institution": BANK_NAMES[bank],
+            "amount": amount,
+            "currency": currency,
+            "currency_symbol": symbol,
+            "purpose": LOAN_PURPOSES[purpose],
+            "disbursement_date": iso_date(disbursed),
+            "due_date": iso_date(due),
+            "status": REPAYMENT_STATUS[status],
+            "days_overdue": overdue or None,
+            "repayment_amount": None if repaid < 0 else repaid
+        })
+    return loans
+
+def pack_applicant(applicant):
+    """Return a CompactApplicant for `applicant`, or the dict itself if it cannot be packed losslessly."""
+    tfd = applicant["tfd"]
+    try:
+        loans = _pack_loans(tfd["loan_history"], tfd["currency"], tfd["currency_symbol"])
+    except (KeyError, TypeError, ValueError, struct.error):
+        loans = None
+    if loans is None:
+        return applicant
+    stripped = dict(applicant, tfd=dict(tfd, loan_history=None))
+    packed = CompactApplicant(_pack_value(stripped), loans)
+    if unpack_applicant(packed) != applicant:
+        return applicant
+    return packed
+
+def unpack_applicant(record):
+    if type(record) is not CompactApplicant:
+        return record
+    applicant = _unpack_value(record.fields)
+    tfd = applicant["tfd"]
+    tfd["loan_history"] = _unpack_loans(record.loans, tfd["currency"], tfd["currency_symbol"])
+    return applicant
+
+class CompactStore(MemoryStore):
+    """MemoryStore holding CompactApplicant records; reads hand back fresh dicts in the usual shape."""
+
+    def _dump(self, applicant):
+        return pack_applicant(applicant)
+
+    def _load(self, record):
+        return unpack_applicant(record)
+
+class SQLiteStore:
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS applicants (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            id TEXT NOT NULL UNIQUE,
+            email_key TEXT NOT NULL,
+            doc TEXT NOT NULL,
+            version INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS applicants_email ON applicants (email_key, seq);
+        CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value REAL NOT NULL);
+        CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+    """
+    QUERY_COLUMNS = {
+        "risk_level": "$.risk_level",
+        "country": "$.location.country",
+        "decision": "$.action_recommendation.decision",
+        "apex_score": "$.apex_score",
+        "created_at": "$.created_at",
+    }
+    QUERY_INDEXES = """
+        CREATE INDEX IF NOT EXISTS applicants_score ON applicants (apex_score, id);
+        CREATE INDEX IF NOT EXISTS applicants_created ON applicants (created_at, id);
+        CREATE INDEX IF NOT EXISTS applicants_risk_score ON applicants (risk_level, apex_score, id);
+        CREATE INDEX IF NOT EXISTS applicants_country_score ON applicants (country, apex_score, id);
+        CREATE INDEX IF NOT EXISTS applicants_decision_score ON applicants (decision, apex_score, id);
+    """
+    PAGE_SIZE = 1000
+    blocking = True
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        conn = self._conn()
+        conn.executescript(self.SCHEMA)
+        self._migrate_query_columns(conn)
+        conn.executescript(self.QUERY_INDEXES)
+        conn.execute("INSERT OR IGNORE INTO meta (name, value) VALUES ('instance', ?)", (uuid.uuid4().hex,))
+        self.instance = conn.execute("SELECT value FROM meta WHERE name = 'instance'").fetchone()[0]
+
+    def _migrate_query_columns(self, conn):
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(applicants)")}
+        missing = [c for c in self.QUERY_COLUMNS if c not in existing]
+        if not missing and "version" in existing:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(applicants)")}
+            missing = [c for c in self.QUERY_COLUMNS if c not in existing]
+            if "version" not in existing:
+                conn.execute("ALTER TABLE applicants ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+            for column in missing:
+                conn.execute(f"ALTER TABLE applicants ADD COLUMN {column}")
+            if missing:
+                assignments = ", ".join(f"{c} = json_extract(doc, '{self.QUERY_COLUMNS[c]}')" for c in missing)
+                conn.execute(f"UPDATE applicants SET {assignments}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def __len__(self):
+        row = self._conn().execute("SELECT value FROM counters WHERE name = 'total'").fetchone()
+        return int(row[0]) if row else 0
+
+    def __contains__(self, applicant_id):
+        return self._conn().execute("SELECT 1 FROM applicants WHERE id = ?", (applicant_id,)).fetchone() is not None
+
+    def get(self, applicant_id):
+        row = self._conn().execute("SELECT doc FROM applicants WHERE id = ?", (applicant_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_versioned(self, applicant_id):
+        """A record and its write version, read together; (None, None) if it does not exist."""
+        row = self._conn().execute("SELECT doc, version FROM applicants WHERE id = ?", (applicant_id,)).fetchone()
+        return (json.loads(row[0]), row[1]) if row else (None, None)
+
+    def id_for_email(self, email_key):
+        row = self._conn().execute(
+            "SELECT id FROM applicants WHERE email_key = ? ORDER BY seq LIMIT 1", (email_key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def version(self, applicant_id):
+        """Write version of a record, or None if it does not exist."""
+        row = self._conn().execute("SELECT version FROM applicants WHERE id = ?", (applicant_id,)).fetchone()
+        return row[0] if row else None
+
+    def store_version(self):
+        row = self._conn().execute("SELECT value FROM counters WHERE name = 'version'").fetchone()
+        return int(row[0]) if row else 0
+
+    def save(self, applicant):
+        conn = self._conn()
+        applicant_id = applicant["id"]
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT doc FROM applicants WHERE id = ?", (applicant_id,)).fetchone()
+            previous = json.loads(row[0]) if row else None
+            doc = json.dumps(applicant)
+            risk_level, country, decision, score, created_at = _query_key(applicant)
+            # Store-wide write counter in `counters`; the record takes the value it advanced to
+            conn.execute(
+                "INSERT INTO counters (name, value) VALUES ('version', 1) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + 1"
+            )
+            version = int(conn.execute("SELECT value FROM counters WHERE name = 'version'").fetchone()[0])
+            if previous is None:
+                conn.execute(
+                    "INSERT INTO applicants (id, email_key, doc, risk_level, country, decision, apex_score, created_at, version) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (applicant_id, normalize_email(applicant["email"]), doc, risk_level, country, decision, score, created_at, version),
+                )
+                deltas = _stats_deltas(applicant)
+            else:
+                conn.execute(
+                    "UPDATE applicants SET email_key = ?, doc = ?, risk_level = ?, country = ?, decision = ?, "
+                    "apex_score = ?, created_at = ?, version = ? WHERE id = ?",
+                    (normalize_email(applicant["email"]), doc, risk_level, country, decision, score, created_at, version, applicant_id),
+                )
+                deltas = [(k, -v) for k, v in _stats_deltas(previous)] + _stats_deltas(applicant)
+            conn.executemany(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                deltas,
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return previous, version
+
+    def page(self, after, limit):
+        rows = self._conn().execute(
+            "SELECT seq, doc FROM applicants WHERE seq > ? ORDER BY seq LIMIT ?", (after, limit + 1)
+        ).fetchall()
+        more = len(rows) > limit
+        rows = rows[:limit]
+        return [json.loads(doc) for _, doc in rows], rows[-1][0] if more and rows else None
+
+    def values(self):
+        after = 0
+        while True:
+            rows = self._conn().execute(
+                "SELECT seq, doc FROM applicants WHERE seq > ? ORDER BY seq LIMIT ?", (after, self.PAGE_SIZE)
+            ).fetchall()
+            if not rows:
+                return
+            for _, doc in rows:
+                yield json.loads(doc)
+            after = rows[-1][0]
+
+    def stats_counters(self):
+        return dict(self._conn().execute("SELECT name, value FROM counters").fetchall())
+
+    def claim_seeding(self):
+        """True for the one caller, across every process on the file, that should seed it."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            empty = conn.execute("SELECT 1 FROM applicants LIMIT 1").fetchone() is None
+            claimed = empty and conn.execute(
+                "INSERT OR IGNORE INTO meta (name, value) VALUES ('seed_claim', ?)", (str(os.getpid()),)
+            ).rowcount == 1
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return claimed
+
+    def query(self, risk_level=None, country=None, decision=None, min_score=None, max_score=None,
+              sort="apex_score", descending=False, after=None, limit=50):
+        clauses, params = [], []
+        for column, value in (("risk_level", risk_level), ("country", country), ("decision", decision)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if min_score is not None:
+            clauses.append("apex_score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            clauses.append("apex_score <= ?")
+            params.append(max_score)
+        if after is not None:
+            clauses.append(f"({sort}, id) {'<' if descending else '>'} (?, ?)")
+            params.extend(after[:2])
+        direction = "DESC" if descending else "ASC"
+        sql = (f"SELECT {sort}, id, doc FROM applicants {'WHERE ' + ' AND '.join(clauses) if clauses else ''} "
+               f"ORDER BY {sort} {direction}, id {direction} LIMIT ?")
+        rows = self._conn().execute(sql, params + [limit + 1]).fetchall()
+        more = len(rows) > limit
+        rows = rows[:limit]
+        return [json.loads(doc) for _, _, doc in rows], (rows[-1][0], rows[-1][1]) if more and rows else None
+
+def make_store(db_path=None):
+    backend = os.environ.get("APEXSCORE_STORE", "memory")
+    if backend == "memory":
+        return MemoryStore()
+    if backend == "compact":
+        _build_vocab()
+        return CompactStore()
+    if backend == "sqlite":
+        return SQLiteStore(db_path or os.environ.get("APEXSCORE_DB_PATH", "apexscore.db"))
+    raise ValueError(f"Unknown APEXSCORE_STORE backend: {backend}")
+
+# Bulk pool workers import this module only to generate records for the parent to save, so they
+# never open a store (for SQLite that would be a connection and a schema write per process)
+DATABASE = None if in_worker_process() else make_store()
+# Serializes writers in this process (seeding thread, search misses, bulk ingestion)
+STORE_LOCK = threading.RLock()
+
+def save_applicant(applicant, summary=None):
+    with STORE_LOCK:
+        _, version = DATABASE.save(applicant)
+        if summary is not None:
+            cache_loan_summary(applicant["id"], version, summary)
+        else:
+            LOAN_SUMMARIES.pop(applicant["id"], None)
+    return applicant
+
+# ETags hash the store's write versions (DATABASE.store_version() and DATABASE.version(id)), which
+# live in the store so every worker sharing it agrees, plus DATABASE.instance, which tells apart
+# stores whose counters restarted. Tags are weak: report timestamps and gzip encoding vary between
+# otherwise equivalent bodies.
+def etag_for(*key):
+    return 'W/"' + hashlib.blake2b(orjson.dumps((DATABASE.instance,) + key), digest_size=12).hexdigest() + '"'
+
+def not_modified(if_none_match, etag):
+    """A 304 response if the If-None-Match header value already names etag, else None."""
+    if if_none_match is None:
+        return None
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in tags or etag.removeprefix("W/") in tags:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    return None
+
+def set_etag(response, etag):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
 def is_valid_email(email):
     pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
     if not re.match(pattern, email):
@@ -40,30 +855,174 @@ def is_valid_email(email):
     domain = email.split('@')[1].lower()
     return domain in VALID_EMAIL_DOMAINS
 
-def generate_email(fn, ln):
-    return f"{fn.lower()}{ln.lower()}{random.randint(1, 999)}@{random.choice(VALID_EMAIL_DOMAINS)}"
+def encode_cursor(position):
+    return base64.urlsafe_b64encode(f"pos:{position}".encode()).decode().rstrip("=")
 
-def calculate_bsi_scores(loan_history, has_defaults, sim_verified, ip_matches):
-    location_consistency = random.randint(70, 95) if not has_defaults else random.randint(40, 65)
-    device_stability = random.randint(70, 95) if not has_defaults else random.randint(40, 65)
-    if sim_verified:
-        sim_changes = random.randint(75, 95)
-    else:
-        sim_changes = random.randint(20, 45)
-    return location_consistency, device_stability, sim_changes
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        prefix, position = raw.split(":", 1)
+        position = int(position)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if prefix != "pos" or position < 0:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return position
+
+def encode_query_cursor(key, sort):
+    return base64.urlsafe_b64encode(orjson.dumps([sort, *key])).decode().rstrip("=")
+
+def decode_query_cursor(cursor, sort):
+    try:
+        raw = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        cursor_sort, value, applicant_id = raw
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    expected = int if sort == "apex_score" else str
+    if cursor_sort != sort or type(value) is not expected or not isinstance(applicant_id, str):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return (value, applicant_id)
+
+def parse_fields(fields):
+    """Parse a `fields=` value such as "id,name.full,apex_score" into key paths."""
+    if not fields:
+        return None
+    return [tuple(f.strip().split(".")) for f in fields.split(",") if f.strip()]
+
+def project(applicant, paths):
+    if paths is None:
+        return applicant
+    result = {}
+    for path in paths:
+        value = applicant
+        for key in path:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = result
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = value
+    return result
+
+class LoanSummary:
+    """Status counts and totals for one loan history, maintained incrementally."""
+    __slots__ = ("total_loans", "paid_on_time", "paid_late", "defaults", "active_loans", "restructured",
+                 "total_borrowed", "total_paid", "outstanding_debt")
+
+    def __init__(self, loan_history=()):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+        for loan in loan_history:
+            self.add(loan)
+
+    def add(self, loan, sign=1):
+        status = loan["status"]
+        self.total_loans += sign
+        self.total_borrowed += sign * loan["amount"]
+        self.total_paid += sign * (loan.get("repayment_amount") or 0)
+        if status in ("Paid On Time", "Paid Early"):
+            self.paid_on_time += sign
+        elif status == "Paid Late":
+            self.paid_late += sign
+        elif status == "Defaulted":
+            self.defaults += sign
+            self.outstanding_debt += sign * loan["amount"]
+        elif status == "Active":
+            self.active_loans += sign
+            self.outstanding_debt += sign * loan["amount"]
+        elif status == "Restructured":
+            self.restructured += sign
 
-def calculate_apex_score(bsi_location, bsi_device, bsi_sim, outstanding_debt, loan_history):
+    def remove(self, loan):
+        self.add(loan, -1)
+
+# Applicant id -> (store version, LoanSummary of its tfd.loan_history); kept beside the record so
+# responses stay plain JSON. An entry only serves a record read at the same version, so a rewrite
+# by any worker sharing the store is a miss. Bounded (LRU) so that with an on-disk store memory
+# follows the working set, not the book size.
+LOAN_SUMMARIES = OrderedDict()
+LOAN_SUMMARY_CACHE_SIZE = int(os.environ.get("APEXSCORE_SUMMARY_CACHE_SIZE", "100000"))
+
+def cache_loan_summary(applicant_id, version, summary):
+    LOAN_SUMMARIES[applicant_id] = (version, summary)
+    LOAN_SUMMARIES.move_to_end(applicant_id)
+    if len(LOAN_SUMMARIES) > LOAN_SUMMARY_CACHE_SIZE:
+        LOAN_SUMMARIES.popitem(last=False)
+
+def get_loan_summary(applicant, version=None):
+    """The LoanSummary of a record read at `version` (from DATABASE.get_versioned).
+
+    Without a version the record's freshness is unknown, so the summary is counted from its
+    history and not cached. Callers that change the summary must copy it first.
+    """
+    entry = LOAN_SUMMARIES.get(applicant["id"]) if version is not None else None
+    hit = entry is not None and entry[0] == version
+    count_cache("loan_summary", hit)
+    if hit:
+        LOAN_SUMMARIES.move_to_end(applicant["id"])
+        return entry[1]
+    summary = LoanSummary(applicant["tfd"]["loan_history"])
+    if version is not None:
+        cache_loan_summary(applicant["id"], version, summary)
+    return summary
+
+def _sync_loan_fields(applicant, summary):
+    applicant["tfd"]["outstanding_debt"] = summary.outstanding_debt
+    applicant["credit_report"]["active_credit_lines"] = summary.active_loans
+    applicant["credit_report"]["derogatory_marks"] = summary.defaults
+    applicant["credit_report"]["total_credit_accounts"] = len(applicant["bank_accounts"]) + summary.total_loans
+
+def _load_for_update(applicant):
+    # Loan edits apply to the record as currently stored, read and written under STORE_LOCK, and
+    # to a copy of its summary so a failed save leaves the cached one intact
+    current, version = DATABASE.get_versioned(applicant["id"])
+    if current is None:
+        raise KeyError(applicant["id"])
+    return current, copy.copy(get_loan_summary(current, version))
+
+def append_loan(applicant, loan):
+    with STORE_LOCK:
+        applicant, summary = _load_for_update(applicant)
+        history = applicant["tfd"]["loan_history"]
+        history.insert(0, loan)
+        history.sort(key=lambda x: x["disbursement_date"], reverse=True)
+        summary.add(loan)
+        _sync_loan_fields(applicant, summary)
+        rescore_applicant(applicant, summary)
+        save_applicant(applicant, summary)
+    return summary
+
+def update_loan_status(applicant, loan_id, status, days_overdue=None, repayment_amount=None):
+    with STORE_LOCK:
+        applicant, summary = _load_for_update(applicant)
+        for loan in applicant["tfd"]["loan_history"]:
+            if loan["loan_id"] == loan_id:
+                summary.remove(loan)
+                loan["status"] = status
+                loan["days_overdue"] = days_overdue
+                loan["repayment_amount"] = repayment_amount
+                summary.add(loan)
+                _sync_loan_fields(applicant, summary)
+                rescore_applicant(applicant, summary)
+                save_applicant(applicant, summary)
+                return summary
+    raise KeyError(loan_id)
+
+def calculate_apex_score(bsi_location, bsi_device, bsi_sim, outstanding_debt, loan_history, summary=None):
     bsi_average = (bsi_location + bsi_device + bsi_sim) / 3
     bsi_component = bsi_average * 0.6
     tfd_score = 60
     
     if loan_history:
-        total_loans = len(loan_history)
-        paid_on_time = sum(1 for loan in loan_history if loan['status'] in ['Paid On Time', 'Paid Early'])
-        paid_late = sum(1 for loan in loan_history if loan['status'] == 'Paid Late')
-        defaults = sum(1 for loan in loan_history if loan['status'] == 'Defaulted')
-        active_loans = sum(1 for loan in loan_history if loan['status'] == 'Active')
-        restructured = sum(1 for loan in loan_history if loan['status'] == 'Restructured')
+        summary = summary if summary is not None else LoanSummary(loan_history)
+        total_loans = summary.total_loans
+        paid_on_time = summary.paid_on_time
+        paid_late = summary.paid_late
+        defaults = summary.defaults
+        active_loans = summary.active_loans
+        restructured = summary.restructured
         
         completed_loans = paid_on_time + paid_late
         if total_loans > 0:
@@ -93,17 +1052,18 @@ def calculate_apex_score(bsi_location, bsi_device, bsi_sim, outstanding_debt, lo
     apex_score = int(bsi_component + tfd_component)
     return max(35, min(95, apex_score))
 
-def generate_ai_recommendation(apex_score, outstanding_debt, loan_history, bsi_location, bsi_device, bsi_sim, currency_symbol):
+def generate_ai_recommendation(apex_score, outstanding_debt, loan_history, bsi_location, bsi_device, bsi_sim, currency_symbol, summary=None):
     if loan_history:
-        paid_on_time = sum(1 for loan in loan_history if loan['status'] in ['Paid On Time', 'Paid Early'])
-        paid_late = sum(1 for loan in loan_history if loan['status'] == 'Paid Late')
-        total_loans = len(loan_history)
-        defaults = sum(1 for loan in loan_history if loan['status'] == 'Defaulted')
-        restructured = sum(1 for loan in loan_history if loan['status'] == 'Restructured')
-        active_loans = sum(1 for loan in loan_history if loan['status'] == 'Active')
-        total_borrowed = sum(loan['amount'] for loan in loan_history)
-        total_paid = sum(loan.get('repayment_amount', 0) for loan in loan_history if loan.get('repayment_amount'))
-        avg_loan = total_borrowed / len(loan_history)
+        summary = summary if summary is not None else LoanSummary(loan_history)
+        paid_on_time = summary.paid_on_time
+        paid_late = summary.paid_late
+        total_loans = summary.total_loans
+        defaults = summary.defaults
+        restructured = summary.restructured
+        active_loans = summary.active_loans
+        total_borrowed = summary.total_borrowed
+        total_paid = summary.total_paid
+        avg_loan = total_borrowed / total_loans
     else:
         paid_on_time = 0
         paid_late = 0
@@ -217,272 +1177,1112 @@ def generate_ai_recommendation(apex_score, outstanding_debt, loan_history, bsi_l
                 "Short-term repayment (weekly/bi-weekly)"
             ]
     }
-def generate_loan_history(num_loans, country_banks, currency_code, currency_symbol):
-    history = []
-    base_date = datetime.datetime.utcnow() - timedelta(days=random.randint(365, 1825))
+
+# Batch scoring over columnar loan data. Each loan is one row: `owner` is the index of the
+# applicant it belongs to, `status` is a code from STATUS_CODES. Arithmetic mirrors
+# calculate_apex_score step for step so results match exactly. BSI signals are inputs, taken from
+# the stored records, since random draws cannot reproduce the scalar path.
+STATUS_CODES = {status: code for code, status in enumerate(REPAYMENT_STATUS)}
+
+def encode_loan_histories(loan_histories):
+    owner, status, amount, repayment = [], [], [], []
+    for i, history in enumerate(loan_histories):
+        for loan in history:
+            owner.append(i)
+            status.append(STATUS_CODES[loan["status"]])
+            amount.append(loan["amount"])
+            repayment.append(loan.get("repayment_amount") or 0)
+    return {
+        "count": len(loan_histories),
+        "owner": np.array(owner, dtype=np.int64),
+        "status": np.array(status, dtype=np.int8),
+        "amount": np.array(amount, dtype=np.int64),
+        "repayment": np.array(repayment, dtype=np.int64),
+    }
+
+def batch_status_counts(loans):
+    n = loans["count"]
+    owner, status = loans["owner"], loans["status"]
+
+    def count(*names):
+        mask = np.isin(status, [STATUS_CODES[name] for name in names])
+        return np.bincount(owner[mask], minlength=n)
+
+    return {
+        "total_loans": np.bincount(owner, minlength=n),
+        "paid_on_time": count("Paid On Time", "Paid Early"),
+        "paid_late": count("Paid Late"),
+        "defaults": count("Defaulted"),
+        "active_loans": count("Active"),
+        "restructured": count("Restructured"),
+        "outstanding_debt": np.bincount(owner, weights=np.where(np.isin(status, [STATUS_CODES["Active"], STATUS_CODES["Defaulted"]]), loans["amount"], 0), minlength=n).astype(np.int64),
+        "total_borrowed": np.bincount(owner, weights=loans["amount"], minlength=n).astype(np.int64),
+        "total_paid": np.bincount(owner, weights=loans["repayment"], minlength=n).astype(np.int64),
+    }
+
+def batch_calculate_tfd_scores(counts, outstanding_debt):
+    total_loans = counts["total_loans"]
+    completed_loans = counts["paid_on_time"] + counts["paid_late"]
+    has_loans = total_loans > 0
+    completion_rate = completed_loans / np.where(has_loans, total_loans, 1)
+    tfd_score = np.where(has_loans, 40 + (completion_rate * 40), 60.0)
+    tfd_score = tfd_score - np.where(has_loans, counts["defaults"] * 8, 0)
+    tfd_score = tfd_score - np.where(has_loans, counts["restructured"] * 4, 0)
+    tfd_score = tfd_score - np.where(has_loans & (counts["active_loans"] > 3), 5, 0)
+    tfd_score = tfd_score + np.where(has_loans, np.minimum(10, counts["paid_on_time"] * 2), 0)
+
+    debt_ratio = np.asarray(outstanding_debt) / 50000
+    tfd_score = tfd_score - np.select([debt_ratio > 1.5, debt_ratio > 1.0, debt_ratio > 0.6], [12, 8, 4], 0)
+    return np.clip(tfd_score, 20, 100)
+
+def batch_calculate_apex_scores(bsi_location, bsi_device, bsi_sim, outstanding_debt, loans, counts=None):
+    counts = counts if counts is not None else batch_status_counts(loans)
+    bsi_average = (np.asarray(bsi_location) + np.asarray(bsi_device) + np.asarray(bsi_sim)) / 3
+    bsi_component = bsi_average * 0.6
+    tfd_component = batch_calculate_tfd_scores(counts, outstanding_debt) * 0.4
+    apex_score = np.trunc(bsi_component + tfd_component).astype(np.int64)
+    return np.clip(apex_score, 35, 95)
+
+def risk_level_for(apex_score):
+    return "Low" if apex_score >= 75 else "Medium" if apex_score >= 50 else "High"
+
+# Version of the scoring rules, stamped on each record as "scoring_version". Bump it whenever
+# calculate_apex_score, generate_ai_recommendation or risk_level_for change their output; records
+# scored under another version are re-scored when read and by the startup sweep (rescore_stale).
+SCORING_VERSION = 1
+
+def is_stale(applicant):
+    return applicant.get("scoring_version") != SCORING_VERSION
+
+def rescore_applicant(applicant, summary=None, apex_score=None):
+    """Recompute apex_score, risk_level and action_recommendation in place from the stored inputs."""
+    bsi, tfd = applicant["bsi"], applicant["tfd"]
+    summary = summary if summary is not None else get_loan_summary(applicant)
+    if apex_score is None:
+        apex_score = calculate_apex_score(bsi["location_consistency"], bsi["device_stability"], bsi["sim_changes"],
+                                          tfd["outstanding_debt"], tfd["loan_history"], summary)
+    applicant["apex_score"] = apex_score
+    applicant["risk_level"] = risk_level_for(apex_score)
+    applicant["action_recommendation"] = generate_ai_recommendation(
+        apex_score, tfd["outstanding_debt"], tfd["loan_history"], bsi["location_consistency"],
+        bsi["device_stability"], bsi["sim_changes"], tfd["currency_symbol"], summary
+    )
+    applicant["scoring_version"] = SCORING_VERSION
+    return applicant
+
+def refresh_scores(applicants):
+    """Re-score and save the stale records among `applicants`, returning them all as now stored."""
+    refreshed = []
+    for applicant in applicants:
+        if is_stale(applicant):
+            with STORE_LOCK:
+                current, version = DATABASE.get_versioned(applicant["id"])
+                if current is not None:
+                    applicant = current
+                    if is_stale(current):
+                        summary = get_loan_summary(current, version)
+                        save_applicant(rescore_applicant(current, summary), summary)
+        refreshed.append(applicant)
+    return refreshed
+
+async def read_scored(applicants):
+    """Async read-path wrapper around refresh_scores; free when nothing is stale."""
+    if not any(map(is_stale, applicants)):
+        return applicants
+    # Always off the event loop, whatever the backend: refresh_scores waits for STORE_LOCK, which
+    # bulk ingestion holds for whole batches
+    return await run_in_threadpool(refresh_scores, applicants)
+
+def batch_score_applicants(applicants):
+    """Re-score stored applicants in one vectorized pass using their recorded BSI signals."""
+    loans = encode_loan_histories([a["tfd"]["loan_history"] for a in applicants])
+    counts = batch_status_counts(loans)
+    apex_scores = batch_calculate_apex_scores(
+        [a["bsi"]["location_consistency"] for a in applicants],
+        [a["bsi"]["device_stability"] for a in applicants],
+        [a["bsi"]["sim_changes"] for a in applicants],
+        [a["tfd"]["outstanding_debt"] for a in applicants],
+        loans,
+        counts,
+    )
+    return {"apex_score": apex_scores, "counts": counts}
+
+class ApplicantGenerator:
+    """Source of synthetic applicants.
+
+    Without a seed it draws from the global `random` module and `uuid4`, as the module-level
+    helpers always have. With a seed (and optionally a clock returning a naive UTC datetime)
+    every field, ids and timestamps included, is reproducible. The clock is read once per
+    applicant; every date in the record is an offset from that reading.
+    """
+
+    def __init__(self, seed=None, clock=None):
+        self.seeded = seed is not None
+        self.random = random.Random(seed) if self.seeded else random
+        self.clock = clock or datetime.datetime.utcnow
+
+    def new_uuid(self):
+        if self.seeded:
+            return uuid.UUID(int=self.random.getrandbits(128), version=4)
+        return uuid.uuid4()
+
+    def email(self, fn, ln):
+        rng = self.random
+        return f"{fn.lower()}{ln.lower()}{rng.randint(1, 999)}@{rng.choice(VALID_EMAIL_DOMAINS)}"
+
+    def bsi_scores(self, loan_history, has_defaults, sim_verified, ip_matches):
+        rng = self.random
+        location_consistency = rng.randint(70, 95) if not has_defaults else rng.randint(40, 65)
+        device_stability = rng.randint(70, 95) if not has_defaults else rng.randint(40, 65)
+        if sim_verified:
+            sim_changes = rng.randint(75, 95)
+        else:
+            sim_changes = rng.randint(20, 45)
+        return location_consistency, device_stability, sim_changes
+
+    def loan_history(self, num_loans, country_banks, currency_code, currency_symbol, today=None):
+        rng = self.random
+        history = []
+        # Dates are day ordinals until the loan dict is built; ordinals sort like the ISO strings
+        base_day = (self.clock().toordinal() if today is None else today) - rng.randint(365, 1825)
     
-    for i in range(num_loans):
-        loan_date = base_date + timedelta(days=random.randint(0, 730))
-        amount = random.randint(500, 50000)
-        status = random.choice(REPAYMENT_STATUS)
-        days_overdue = 0
+        for i in range(num_loans):
+            disbursed = base_day + rng.randint(0, 730)
+            amount = rng.randint(500, 50000)
+            status = rng.choice(REPAYMENT_STATUS)
+            days_overdue = 0
         
-        if status == "Paid Late":
-            days_overdue = random.randint(1, 30)
-        elif status == "Defaulted":
-            days_overdue = random.randint(31, 365)
+            if status == "Paid Late":
+                days_overdue = rng.randint(1, 30)
+            elif status == "Defaulted":
+                days_overdue = rng.randint(31, 365)
         
-        repayment_amount = None
-        if status in ["Paid On Time", "Paid Early", "Paid Late"]:
-            repayment_amount = amount + int(amount * random.uniform(0.05, 0.25))
+            repayment_amount = None
+            if status in ["Paid On Time", "Paid Early", "Paid Late"]:
+                repayment_amount = amount + int(amount * rng.uniform(0.05, 0.25))
         
-        loan = {
-            "loan_id": f"LN-{uuid.uuid4().hex[:8].upper()}",
-            "institution": random.choice(country_banks),
-            "amount": amount,
-            "currency": currency_code,
-            "currency_symbol": currency_symbol,
-            "purpose": random.choice(LOAN_PURPOSES),
-            "disbursement_date": loan_date.strftime("%Y-%m-%d"),
-            "due_date": (loan_date + timedelta(days=random.randint(30, 365))).strftime("%Y-%m-%d"),
-            "status": status,
-            "days_overdue": days_overdue if days_overdue > 0 else None,
-            "repayment_amount": repayment_amount
-        }
-        history.append(loan)
+            loan = {
+                "loan_id": f"LN-{self.new_uuid().hex[:8].upper()}",
+                "institution": rng.choice(country_banks),
+                "amount": amount,
+                "currency": currency_code,
+                "currency_symbol": currency_symbol,
+                "purpose": rng.choice(LOAN_PURPOSES),
+                "disbursement_date": iso_date(disbursed),
+                "due_date": iso_date(disbursed + rng.randint(30, 365)),
+                "status": status,
+                "days_overdue": days_overdue if days_overdue > 0 else None,
+                "repayment_amount": repayment_amount
+            }
+            history.append((disbursed, loan))
     
-    return sorted(history, key=lambda x: x["disbursement_date"], reverse=True)
+        history.sort(key=lambda pair: pair[0], reverse=True)
+        return [loan for _, loan in history]
 
-def generate_applicant(email=None):
-    country = random.choice(list(COUNTRIES.keys()))
-    c = COUNTRIES[country]
-    fn = random.choice(FIRST_NAMES)
-    ln = random.choice(LAST_NAMES)
-    mid = random.choice(MIDDLE_NAMES)
+    def build(self, email=None):
+        rng = self.random
+        now = self.clock()
+        country = rng.choice(list(COUNTRIES.keys()))
+        c = COUNTRIES[country]
+        fn = rng.choice(FIRST_NAMES)
+        ln = rng.choice(LAST_NAMES)
+        mid = rng.choice(MIDDLE_NAMES)
 
-    if email is None:
-        email = generate_email(fn, ln)
+        if email is None:
+            email = self.email(fn, ln)
     
-    num_loans = random.randint(5, 10)
-    loan_history = generate_loan_history(num_loans, c["banks"], c["currency"], c["symbol"])
-    has_defaults = any(loan['status'] == 'Defaulted' for loan in loan_history)
+        num_loans = rng.randint(5, 10)
+        with stage("generate.loan_history"):
+            loan_history = self.loan_history(num_loans, c["banks"], c["currency"], c["symbol"], now.toordinal())
+        summary = LoanSummary(loan_history)
+        has_defaults = summary.defaults > 0
+        outstanding_debt = summary.outstanding_debt
     
-    outstanding_debt = 0
-    for loan in loan_history:
-        if loan['status'] == 'Active':
-            outstanding_debt += loan['amount']
-        elif loan['status'] == 'Defaulted':
-            outstanding_debt += loan['amount']
+        sim_verified = rng.choice([True, True, True, False])
+        ip_matches_location = rng.random() > 0.25
+        with stage("score.bsi_apex"):
+            bsi_location, bsi_device, bsi_sim = self.bsi_scores(loan_history, has_defaults, sim_verified, ip_matches_location)
+            ip_region_match = rng.randint(85, 95) if ip_matches_location else rng.randint(25, 45)
+            apex_score = calculate_apex_score(bsi_location, bsi_device, bsi_sim, outstanding_debt, loan_history, summary)
+        with stage("score.recommendation"):
+            action_recommendation = generate_ai_recommendation(apex_score, outstanding_debt, loan_history, bsi_location, bsi_device, bsi_sim, c["symbol"], summary)
     
-    sim_verified = random.choice([True, True, True, False])
-    ip_matches_location = random.random() > 0.25
-    bsi_location, bsi_device, bsi_sim = calculate_bsi_scores(loan_history, has_defaults, sim_verified, ip_matches_location)
-    ip_region_match = random.randint(85, 95) if ip_matches_location else random.randint(25, 45)
-    apex_score = calculate_apex_score(bsi_location, bsi_device, bsi_sim, outstanding_debt, loan_history)
+        device_type = rng.choice(["Android", "iOS"])
+        if device_type == "Android":
+            model = rng.choice(c["android_models"])
+            os_version = rng.choice(["Android 13", "Android 12", "Android 11"])
+        else:
+            model = rng.choice(c["ios_models"])
+            os_version = rng.choice(["iOS 16", "iOS 15", "iOS 17"])
     
-    device_type = random.choice(["Android", "iOS"])
-    if device_type == "Android":
-        model = random.choice(c["android_models"])
-        os_version = random.choice(["Android 13", "Android 12", "Android 11"])
-    else:
-        model = random.choice(c["ios_models"])
-        os_version = random.choice(["iOS 16", "iOS 15", "iOS 17"])
+        city_name = rng.choice(c["cities"])
+        email_login_hours = rng.randint(1, 48)
+        sim_activity_hours = rng.randint(1, 72)
     
-    city_name = random.choice(c["cities"])
-    last_email_login = (datetime.datetime.utcnow() - timedelta(hours=random.randint(1, 48))).isoformat()
-    last_sim_activity = (datetime.datetime.utcnow() - timedelta(hours=random.randint(1, 72))).isoformat()
+        # First-seen order rather than set order, which varies with string hash randomization
+        banks_used = list(dict.fromkeys(loan['institution'] for loan in loan_history))
+        bank_accounts = []
+        for bank in banks_used[:3]:
+            bank_accounts.append({
+                "bank_name": bank,
+                "account_number": str(rng.randint(1000000000, 9999999999)),
+                "account_type": rng.choice(["Savings", "Current"]),
+                "status": rng.choice(["Active", "Active", "Active", "Dormant"])
+            })
     
-    banks_used = list(set(loan['institution'] for loan in loan_history))
-    bank_accounts = []
-    for bank in banks_used[:3]:
-        bank_accounts.append({
-            "bank_name": bank,
-            "account_number": str(random.randint(1000000000, 9999999999)),
-            "account_type": random.choice(["Savings", "Current"]),
-            "status": random.choice(["Active", "Active", "Active", "Dormant"])
-        })
+        # Generate income data
+        monthly_income = rng.randint(1000, 15000)
+        income_source = rng.choice(INCOME_SOURCES)
+        income_verification_date = (now - timedelta(days=rng.randint(1, 90))).isoformat()
     
-    # Generate income data
-    monthly_income = random.randint(1000, 15000)
-    income_source = random.choice(INCOME_SOURCES)
-    income_verification_date = (datetime.datetime.utcnow() - timedelta(days=random.randint(1, 90))).isoformat()
-    
-    # Generate expenditure breakdown
-    total_expenditure = int(monthly_income * random.uniform(0.5, 0.95))
-    expenditure_breakdown = {
-        "Housing": int(total_expenditure * random.uniform(0.25, 0.35)),
-        "Transportation": int(total_expenditure * random.uniform(0.10, 0.15)),
-        "Food & Groceries": int(total_expenditure * random.uniform(0.15, 0.20)),
-        "Utilities": int(total_expenditure * random.uniform(0.05, 0.10)),
-        "Healthcare": int(total_expenditure * random.uniform(0.05, 0.10)),
-        "Entertainment": int(total_expenditure * random.uniform(0.05, 0.08)),
-        "Debt Repayment": int(outstanding_debt * 0.02) if outstanding_debt > 0 else 0,
-        "Savings": max(0, monthly_income - total_expenditure),
-        "Other": int(total_expenditure * random.uniform(0.03, 0.07))
-    }
+        # Generate expenditure breakdown
+        total_expenditure = int(monthly_income * rng.uniform(0.5, 0.95))
+        expenditure_breakdown = {
+            "Housing": int(total_expenditure * rng.uniform(0.25, 0.35)),
+            "Transportation": int(total_expenditure * rng.uniform(0.10, 0.15)),
+            "Food & Groceries": int(total_expenditure * rng.uniform(0.15, 0.20)),
+            "Utilities": int(total_expenditure * rng.uniform(0.05, 0.10)),
+            "Healthcare": int(total_expenditure * rng.uniform(0.05, 0.10)),
+            "Entertainment": int(total_expenditure * rng.uniform(0.05, 0.08)),
+            "Debt Repayment": int(outstanding_debt * 0.02) if outstanding_debt > 0 else 0,
+            "Savings": max(0, monthly_income - total_expenditure),
+            "Other": int(total_expenditure * rng.uniform(0.03, 0.07))
+        }
     
-    # Generate credit report from bureau
-    credit_bureau = random.choice(CREDIT_BUREAUS)
-    credit_report_date = (datetime.datetime.utcnow() - timedelta(days=random.randint(1, 30))).isoformat()
-    credit_score = random.randint(300, 850)
+        # Generate credit report from bureau
+        credit_bureau = rng.choice(CREDIT_BUREAUS)
+        credit_report_date = (now - timedelta(days=rng.randint(1, 30))).isoformat()
+        credit_score = rng.randint(300, 850)
     
-    # Calculate debt-to-income ratio
-    monthly_debt_payment = expenditure_breakdown["Debt Repayment"]
-    dti_ratio = round((monthly_debt_payment / monthly_income) * 100, 2) if monthly_income > 0 else 0
-
-    applicant = {
-        "id": str(uuid.uuid4()),
-        "email": email,
-        "name": {"first": fn, "middle": mid, "last": ln, "full": f"{fn} {mid} {ln}"},
-        "phone": f"{c['code']} {random.randint(700000000, 999999999)}",
-        "occupation": random.choice(JOBS),
-        "location": {
-            "city": city_name,
-            "country": country,
-            "address": f"{random.randint(10, 300)} Main Street",
-            "coordinates": {"lat": round(random.uniform(-60, 60), 4), "lng": round(random.uniform(-120, 120), 4)}
-        },
-        "network": {
-            "isp": random.choice(c["isps"]),
-            "ip_address": f"{random.randint(1, 255)}.{random.randint(1, 255)}.{random.randint(1, 255)}.{random.randint(1, 255)}",
-            "ip_location": city_name if ip_matches_location else random.choice(c["cities"]),
-            "ip_matches_declared_address": ip_matches_location
-        },
-        "sim_registration": "VERIFIED" if sim_verified else "UNVERIFIED",
-        "activity_log": {
-            "last_email_login": last_email_login,
-            "last_sim_activity": last_sim_activity,
-            "email_sim_sync": abs((datetime.datetime.fromisoformat(last_email_login) - datetime.datetime.fromisoformat(last_sim_activity)).total_seconds()) < 86400
-        },
-        "device_fingerprint": {
-            "device_id": str(uuid.uuid4()),
-            "device_type": device_type,
-            "model": model,
-            "os_version": os_version,
-            "is_rooted": random.choice([False, False, False, True]),
-            "vpn_detected": random.choice([False, False, True]),
-        },
-        "bank_accounts": bank_accounts,
-        "financial_profile": {
-            "monthly_income": monthly_income,
-            "income_source": income_source,
-            "income_verification_date": income_verification_date,
-            "monthly_expenditure": total_expenditure,
-            "expenditure_breakdown": expenditure_breakdown,
-            "disposable_income": monthly_income - total_expenditure,
-            "debt_to_income_ratio": dti_ratio,
-            "currency": c["currency"],
-            "currency_symbol": c["symbol"]
-        },
-        "credit_report": {
-            "bureau": credit_bureau,
-            "report_date": credit_report_date,
-            "credit_score": credit_score,
-            "credit_rating": "Excellent" if credit_score >= 750 else "Good" if credit_score >= 650 else "Fair" if credit_score >= 550 else "Poor",
-            "total_credit_accounts": len(bank_accounts) + len(loan_history),
-            "active_credit_lines": len([l for l in loan_history if l['status'] == 'Active']),
-            "derogatory_marks": len([l for l in loan_history if l['status'] == 'Defaulted']),
-            "credit_utilization": round((outstanding_debt / (monthly_income * 12)) * 100, 2) if monthly_income > 0 else 0,
-            "oldest_account_age_months": random.randint(12, 120),
-            "recent_inquiries": random.randint(0, 5)
-        },
-        "tfd": {
-            "currency": c["currency"],
-            "currency_symbol": c["symbol"],
-            "outstanding_debt": outstanding_debt,
-            "loan_history": loan_history
-        },
-        "bsi": {
-            "location_consistency": bsi_location,
-            "device_stability": bsi_device,
-            "sim_changes": bsi_sim,
-            "ip_region_match": ip_region_match,
-            "travel_frequency": random.randint(60, 95) if not has_defaults else random.randint(40, 70)
-        },
-        "apex_score": apex_score,
-        "risk_level": "Low" if apex_score >= 75 else "Medium" if apex_score >= 50 else "High",
-        "action_recommendation": generate_ai_recommendation(apex_score, outstanding_debt, loan_history, bsi_location, bsi_device, bsi_sim, c["symbol"]),
-        "created_at": datetime.datetime.utcnow().isoformat()
-    }
+        # Calculate debt-to-income ratio
+        monthly_debt_payment = expenditure_breakdown["Debt Repayment"]
+        dti_ratio = round((monthly_debt_payment / monthly_income) * 100, 2) if monthly_income > 0 else 0
 
-    DATABASE[applicant["id"]] = applicant
-    return applicant
+        applicant = {
+            "id": str(self.new_uuid()),
+            "email": email,
+            "name": {"first": fn, "middle": mid, "last": ln, "full": f"{fn} {mid} {ln}"},
+            "phone": f"{c['code']} {rng.randint(700000000, 999999999)}",
+            "occupation": rng.choice(JOBS),
+            "location": {
+                "city": city_name,
+                "country": country,
+                "address": f"{rng.randint(10, 300)} Main Street",
+                "coordinates": {"lat": round(rng.uniform(-60, 60), 4), "lng": round(rng.uniform(-120, 120), 4)}
+            },
+            "network": {
+                "isp": rng.choice(c["isps"]),
+                "ip_address": f"{rng.randint(1, 255)}.{rng.randint(1, 255)}.{rng.randint(1, 255)}.{rng.randint(1, 255)}",
+                "ip_location": city_name if ip_matches_location else rng.choice(c["cities"]),
+                "ip_matches_declared_address": ip_matches_location
+            },
+            "sim_registration": "VERIFIED" if sim_verified else "UNVERIFIED",
+            "activity_log": {
+                "last_email_login": (now - timedelta(hours=email_login_hours)).isoformat(),
+                "last_sim_activity": (now - timedelta(hours=sim_activity_hours)).isoformat(),
+                "email_sim_sync": abs(email_login_hours - sim_activity_hours) < 24
+            },
+            "device_fingerprint": {
+                "device_id": str(self.new_uuid()),
+                "device_type": device_type,
+                "model": model,
+                "os_version": os_version,
+                "is_rooted": rng.choice([False, False, False, True]),
+                "vpn_detected": rng.choice([False, False, True]),
+            },
+            "bank_accounts": bank_accounts,
+            "financial_profile": {
+                "monthly_income": monthly_income,
+                "income_source": income_source,
+                "income_verification_date": income_verification_date,
+                "monthly_expenditure": total_expenditure,
+                "expenditure_breakdown": expenditure_breakdown,
+                "disposable_income": monthly_income - total_expenditure,
+                "debt_to_income_ratio": dti_ratio,
+                "currency": c["currency"],
+                "currency_symbol": c["symbol"]
+            },
+            "credit_report": {
+                "bureau": credit_bureau,
+                "report_date": credit_report_date,
+                "credit_score": credit_score,
+                "credit_rating": "Excellent" if credit_score >= 750 else "Good" if credit_score >= 650 else "Fair" if credit_score >= 550 else "Poor",
+                "total_credit_accounts": len(bank_accounts) + len(loan_history),
+                "active_credit_lines": summary.active_loans,
+                "derogatory_marks": summary.defaults,
+                "credit_utilization": round((outstanding_debt / (monthly_income * 12)) * 100, 2) if monthly_income > 0 else 0,
+                "oldest_account_age_months": rng.randint(12, 120),
+                "recent_inquiries": rng.randint(0, 5)
+            },
+            "tfd": {
+                "currency": c["currency"],
+                "currency_symbol": c["symbol"],
+                "outstanding_debt": outstanding_debt,
+                "loan_history": loan_history
+            },
+            "bsi": {
+                "location_consistency": bsi_location,
+                "device_stability": bsi_device,
+                "sim_changes": bsi_sim,
+                "ip_region_match": ip_region_match,
+                "travel_frequency": rng.randint(60, 95) if not has_defaults else rng.randint(40, 70)
+            },
+            "apex_score": apex_score,
+            "risk_level": risk_level_for(apex_score),
+            "action_recommendation": action_recommendation,
+            "scoring_version": SCORING_VERSION,
+            "created_at": now.isoformat()
+        }
+
+        return applicant, summary
+
+    def applicant(self, email=None):
+        return self.build(email)[0]
 
-for _ in range(150):
-    generate_applicant()
+class FixedClock:
+    """Clock that always reads the same instant; picklable so it can be sent to pool workers."""
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+DEFAULT_GENERATOR = ApplicantGenerator()
+
+def generate_email(fn, ln):
+    return DEFAULT_GENERATOR.email(fn, ln)
+
+def calculate_bsi_scores(loan_history, has_defaults, sim_verified, ip_matches):
+    return DEFAULT_GENERATOR.bsi_scores(loan_history, has_defaults, sim_verified, ip_matches)
+
+def generate_loan_history(num_loans, country_banks, currency_code, currency_symbol):
+    return DEFAULT_GENERATOR.loan_history(num_loans, country_banks, currency_code, currency_symbol)
+
+def generate_applicant(email=None, save=True, generator=None):
+    applicant, summary = (generator or DEFAULT_GENERATOR).build(email)
+    if not save:
+        return applicant
+    return save_applicant(applicant, summary)
+
+# Bulk generation: work is cut into fixed-size chunks, each with its own derived seed, so the
+# output for a given seed does not depend on how many worker processes run the chunks.
+# Workers are never forked from the served process: a fork copies whatever locks the seed thread,
+# profiler or request threads hold at that moment, and the child can wait on them forever.
+BULK_CHUNK_SIZE = 500
+BULK_MAX_COUNT = 100000
+BULK_MAX_WORKERS = os.cpu_count() or 1
+BULK_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+def _generate_chunk(seed, count, emails, clock=None):
+    if emails:
+        # Each emailed record is seeded from the request seed and its own address, so ids repeat
+        # only for a repeated (seed, email) pair, never for another email at the same position
+        return [ApplicantGenerator(f"{seed}:{normalize_email(email)}", clock).applicant(email) for email in emails]
+    generator = ApplicantGenerator(seed, clock)
+    return [generator.applicant() for _ in range(count)]
+
+def _plan_chunks(count, emails, seed, clock):
+    rng = random.Random(seed)
+    chunks = []
+    if emails:
+        for i in range(0, len(emails), BULK_CHUNK_SIZE):
+            chunk_seed = seed if seed is not None else rng.getrandbits(64)
+            chunks.append((chunk_seed, 0, emails[i:i + BULK_CHUNK_SIZE], clock))
+    else:
+        for i in range(0, count, BULK_CHUNK_SIZE):
+            chunks.append((rng.getrandbits(64), min(BULK_CHUNK_SIZE, count - i), None, clock))
+    return chunks
+
+def generate_applicants_bulk(count=0, emails=None, seed=None, workers=None, clock=None):
+    """Yield generated applicants chunk by chunk, spreading chunks across a process pool."""
+    chunks = _plan_chunks(count, emails, seed, clock)
+    workers = max(1, min(workers or BULK_MAX_WORKERS, BULK_MAX_WORKERS, len(chunks)))
+    if workers == 1:
+        for chunk in chunks:
+            yield _generate_chunk(*chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers, mp_context=BULK_MP_CONTEXT) as pool:
+        yield from pool.map(_generate_chunk, *zip(*chunks))
+
+def ingest_applicants_bulk(count=0, emails=None, seed=None, workers=None):
+    """Generate and save applicants; returns their ids.
+
+    The seed reproduces every field except the id. Stored records always get a fresh uuid4, so a
+    caller repeating a seed adds new applicants instead of overwriting the ones it created before.
+    """
+    if emails:
+        seen = set()
+        fresh = []
+        for email in emails:
+            key = normalize_email(email)
+            if key not in seen and DATABASE.id_for_email(key) is None:
+                seen.add(key)
+                fresh.append(email)
+        emails = fresh
+    inserted = []
+    for batch in generate_applicants_bulk(count, emails, seed, workers):
+        with STORE_LOCK:
+            for applicant in batch:
+                applicant["id"] = str(uuid.uuid4())
+                save_applicant(applicant)
+                inserted.append(applicant["id"])
+    return inserted
+
+# Startup seeding. APEXSCORE_STARTUP picks how the store is filled:
+#   eager      - fill at import time before serving (the original behaviour)
+#   background - serve immediately and fill from a daemon thread (default)
+#   lazy       - fill on the first request that reads the store
+# APEXSCORE_SNAPSHOT points at an NDJSON file (see the CLI below) to load instead of generating.
+# Seeding, from a snapshot or generated, is claimed through the store, so workers sharing a SQLite
+# file fill it only once and later starts leave its records (and their versions) alone.
+STARTUP_MODE = os.environ.get("APEXSCORE_STARTUP", "background")
+SEED_COUNT = int(os.environ.get("APEXSCORE_SEED_COUNT", "150"))
+SNAPSHOT_PATH = os.environ.get("APEXSCORE_SNAPSHOT")
+
+SEED_STATE = {"state": "pending", "started_at": None, "finished_at": None, "error": None}
+_SEED_LOCK = threading.Lock()
+_SEEDED = threading.Event()
+
+def load_snapshot(path):
+    loaded = 0
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                save_applicant(json.loads(line))
+                loaded += 1
+    return loaded
+
+def seed_store():
+    with _SEED_LOCK:
+        if SEED_STATE["state"] != "pending":
+            return
+        SEED_STATE["state"] = "loading"
+    SEED_STATE["started_at"] = time.perf_counter()
+    try:
+        if not DATABASE.claim_seeding():
+            start_rescore_sweep()
+        elif SNAPSHOT_PATH:
+            load_snapshot(SNAPSHOT_PATH)
+            start_rescore_sweep()
+        else:
+            for _ in range(SEED_COUNT):
+                generate_applicant()
+        SEED_STATE["state"] = "ready"
+    except Exception as exc:
+        SEED_STATE["state"] = "failed"
+        SEED_STATE["error"] = str(exc)
+    finally:
+        SEED_STATE["finished_at"] = time.perf_counter()
+        _SEEDED.set()
+
+# Records that were not generated by this process (a snapshot or an existing SQLite file) may have
+# been scored under older rules. A daemon thread walks the store in pages of APEXSCORE_RESCORE_BATCH
+# after seeding and re-scores each page's stale records under the store lock, saving them through
+# save_applicant so stats counters and query indexes follow. Reads re-score whatever it has not reached.
+RESCORE_BATCH_SIZE = int(os.environ.get("APEXSCORE_RESCORE_BATCH", "500"))
+RESCORE_STATE = {"state": "idle", "scanned": 0, "rescored": 0, "error": None}
+
+def rescore_stale(batch_size=RESCORE_BATCH_SIZE):
+    """Re-score every stale record in the store, a page at a time; returns how many were saved."""
+    after = 0
+    rescored = 0
+    while after is not None:
+        page, after = DATABASE.page(after, batch_size)
+        RESCORE_STATE["scanned"] += len(page)
+        stale = [a for a in page if is_stale(a)]
+        if stale:
+            with stage("score.rescore"):
+                refresh_scores(stale)
+            rescored += len(stale)
+            RESCORE_STATE["rescored"] += len(stale)
+    return rescored
+
+def _run_rescore_sweep():
+    RESCORE_STATE["state"] = "running"
+    try:
+        rescore_stale()
+        RESCORE_STATE["state"] = "done"
+    except Exception as exc:
+        RESCORE_STATE["state"] = "failed"
+        RESCORE_STATE["error"] = str(exc)
+
+def start_rescore_sweep():
+    threading.Thread(target=_run_rescore_sweep, name="apexscore-rescore", daemon=True).start()
+
+def ensure_seeded():
+    """Block until startup seeding has finished, running it here if nothing has started it."""
+    if _SEEDED.is_set():
+        return
+    if SEED_STATE["state"] == "pending":
+        seed_store()
+    _SEEDED.wait()
+
+def start_seeding():
+    if STARTUP_MODE == "eager":
+        seed_store()
+    elif STARTUP_MODE == "background":
+        threading.Thread(target=seed_store, name="apexscore-seed", daemon=True).start()
+
+# Generation and scoring run on their own bounded executor so bursts of search misses or bulk
+# jobs cannot starve the event loop or Starlette's shared threadpool. Once
+# APEXSCORE_GENERATION_QUEUE jobs are queued or running, new ones are refused with a 503.
+GENERATION_WORKERS = int(os.environ.get("APEXSCORE_GENERATION_WORKERS", "4"))
+GENERATION_QUEUE_LIMIT = int(os.environ.get("APEXSCORE_GENERATION_QUEUE", "64"))
+GENERATION_EXECUTOR = ThreadPoolExecutor(max_workers=GENERATION_WORKERS, thread_name_prefix="apexscore-gen")
+_GENERATION_SLOTS = threading.BoundedSemaphore(GENERATION_QUEUE_LIMIT)
+
+def reserve_generation():
+    """Take a generation slot or refuse with a 503; returns a release callable that is safe to call twice."""
+    if not _GENERATION_SLOTS.acquire(blocking=False):
+        with METRICS_LOCK:
+            GENERATION_JOBS["rejected"] += 1
+        raise HTTPException(status_code=503, detail="Generation capacity exhausted, retry shortly", headers={"Retry-After": "1"})
+    with METRICS_LOCK:
+        GENERATION_JOBS["running"] += 1
+    once = threading.Lock()
+
+    def release(*_):
+        if once.acquire(blocking=False):
+            _GENERATION_SLOTS.release()
+            with METRICS_LOCK:
+                GENERATION_JOBS["running"] -= 1
+    return release
+
+def submit_generation(fn, *args):
+    release = reserve_generation()
+    try:
+        future = GENERATION_EXECUTOR.submit(fn, *args)
+    except BaseException:
+        release()
+        raise
+    future.add_done_callback(release)
+    return future
+
+async def read_store(fn, *args):
+    """Call a store read, off the event loop when the backend does I/O."""
+    if DATABASE.blocking:
+        return await run_in_threadpool(fn, *args)
+    return fn(*args)
+
+async def wait_seeded():
+    if STARTUP_MODE == "lazy" and not _SEEDED.is_set():
+        await run_in_threadpool(ensure_seeded)
 
 @app.get("/")
-def root():
-    return {"status": "ApexScore API running", "version": "2.0"}
+async def root():
+    started, finished = SEED_STATE["started_at"], SEED_STATE["finished_at"]
+    return {
+        "status": "ApexScore API running",
+        "version": "2.0",
+        "ready": SEED_STATE["state"] == "ready",
+        "startup": {
+            "mode": STARTUP_MODE,
+            "state": SEED_STATE["state"],
+            "applicants_loaded": await read_store(len, DATABASE),
+            "seed_seconds": round(finished - started, 3) if started and finished else None,
+            "error": SEED_STATE["error"]
+        },
+        "scoring": {"version": SCORING_VERSION, "sweep": RESCORE_STATE}
+    }
+
+# Upper bound on one page so a single request cannot materialize (or, for CompactStore, unpack on
+# the event loop) the whole book. Larger limits are clamped rather than refused, and the
+# next_cursor of the short page leads on to the rest.
+PAGE_LIMIT_MAX = int(os.environ.get("APEXSCORE_PAGE_LIMIT_MAX", "1000"))
 
 @app.get("/api/applicants")
-def list_applicants(limit: int = 50):
-    return {"applicants": list(DATABASE.values())[:limit]}
+async def list_applicants(request: Request, response: Response,
+                          limit: int = Query(50, ge=0), cursor: str = None, fields: str = None,
+                          risk_level: Literal["Low", "Medium", "High"] = None, country: str = None,
+                          decision: str = None, min_score: int = None, max_score: int = None,
+                          sort: Literal["apex_score", "created_at"] = None, order: Literal["asc", "desc"] = "asc"):
+    await wait_seeded()
+    version = await read_store(DATABASE.store_version)
+    etag = etag_for("applicants", version, sorted(request.query_params.multi_items()))
+    cached = not_modified(request.headers.get("if-none-match"), etag)
+    if cached is not None:
+        return cached
+    set_etag(response, etag)
+    limit = min(limit, PAGE_LIMIT_MAX)
+    paths = parse_fields(fields)
+    filtered = any(v is not None for v in (risk_level, country, decision, min_score, max_score, sort))
+    if filtered:
+        sort = sort or "apex_score"
+        after = decode_query_cursor(cursor, sort) if cursor else None
+        while True:
+            applicants, next_after = await read_store(
+                DATABASE.query, risk_level, country, decision, min_score, max_score, sort, order == "desc", after, limit
+            )
+            if not any(map(is_stale, applicants)):
+                break
+            # Re-scoring can move records out of the filter or along the sort, so the page is
+            # selected again once the stale records in it are saved with their current scores
+            await read_scored(applicants)
+        return {
+            "applicants": [project(a, paths) for a in applicants],
+            "next_cursor": encode_query_cursor(next_after, sort) if next_after is not None else None
+        }
+    after = decode_cursor(cursor) if cursor else 0
+    applicants, next_after = await read_store(DATABASE.page, after, limit)
+    applicants = await read_scored(applicants)
+    return {
+        "applicants": [project(a, paths) for a in applicants],
+        "next_cursor": encode_cursor(next_after) if next_after is not None else None
+    }
+
+# Single-flight for search misses: concurrent lookups of the same new email share one
+# generation job instead of each inserting its own applicant.
+_SEARCH_INFLIGHT = {}
+_SEARCH_INFLIGHT_LOCK = threading.Lock()
+
+def _resolve_search(key, email):
+    try:
+        # Another flight may have finished between the caller's lookup and this job starting
+        applicant_id = DATABASE.id_for_email(key)
+        if applicant_id is not None:
+            return DATABASE.get(applicant_id)
+        return generate_applicant(email)
+    finally:
+        with _SEARCH_INFLIGHT_LOCK:
+            del _SEARCH_INFLIGHT[key]
+
+def search_flight(email):
+    """Return a future for the applicant with `email`, starting at most one generation per email."""
+    key = normalize_email(email)
+    with _SEARCH_INFLIGHT_LOCK:
+        flight = _SEARCH_INFLIGHT.get(key)
+        if flight is None:
+            flight = _SEARCH_INFLIGHT[key] = submit_generation(_resolve_search, key, email)
+    return flight
+
+class BulkRequest(BaseModel):
+    count: int = Field(0, ge=0, le=BULK_MAX_COUNT)
+    emails: list[str] = Field(default_factory=list, max_length=BULK_MAX_COUNT)
+    seed: int | None = None
+    workers: int | None = Field(None, ge=1, le=BULK_MAX_WORKERS)
+
+@app.post("/api/applicants/bulk")
+async def bulk_create_applicants(request: BulkRequest):
+    invalid = [e for e in request.emails if not is_valid_email(e)]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Invalid email format or domain: {', '.join(invalid[:5])}")
+    if not request.count and not request.emails:
+        raise HTTPException(status_code=400, detail="Provide a count or a list of emails")
+    started = time.perf_counter()
+    ids = await asyncio.wrap_future(submit_generation(ingest_applicants_bulk, request.count, request.emails, request.seed, request.workers))
+    elapsed = time.perf_counter() - started
+    return {
+        "inserted": len(ids),
+        "ids": ids,
+        "total_applicants": await read_store(len, DATABASE),
+        "elapsed_seconds": round(elapsed, 3)
+    }
 
 @app.get("/api/search")
-def search(email: str = Query(...)):
+async def search(email: str = Query(...)):
     if not is_valid_email(email):
         raise HTTPException(status_code=400, detail=f"Invalid email format or domain. Only {', '.join(VALID_EMAIL_DOMAINS)} are accepted.")
-    for applicant in DATABASE.values():
-        if applicant["email"].lower() == email.lower():
-            return applicant
-    return generate_applicant(email)
+    with stage("search.lookup"):
+        applicant_id = await read_store(DATABASE.id_for_email, normalize_email(email))
+        applicant = await read_store(DATABASE.get, applicant_id) if applicant_id is not None else None
+    if applicant is not None:
+        return (await read_scored([applicant]))[0]
+    with stage("search.generate"):
+        return await asyncio.wrap_future(search_flight(email))
 
 @app.get("/api/applicant/{id}")
-def get_applicant(id: str):
-    applicant = DATABASE.get(id)
+async def get_applicant(id: str, request: Request, response: Response):
+    version = await read_store(DATABASE.version, id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Applicant not found")
+    etag = etag_for("applicant", id, version)
+    cached = not_modified(request.headers.get("if-none-match"), etag)
+    if cached is not None:
+        return cached
+    applicant = await read_store(DATABASE.get, id)
     if not applicant:
         raise HTTPException(status_code=404, detail="Applicant not found")
-    return applicant
+    set_etag(response, etag)
+    return (await read_scored([applicant]))[0]
+
+@app.get("/metrics")
+async def metrics():
+    return Response(content=render_metrics(await read_store(len, DATABASE)), media_type="text/plain; version=0.0.4")
 
 @app.get("/api/stats")
-def stats():
-    total = len(DATABASE)
-    high = len([a for a in DATABASE.values() if a["risk_level"] == "High"])
-    medium = len([a for a in DATABASE.values() if a["risk_level"] == "Medium"])
-    low = len([a for a in DATABASE.values() if a["risk_level"] == "Low"])
-    avg_score = sum(a["apex_score"] for a in DATABASE.values()) / total if total > 0 else 0
+async def stats():
+    await wait_seeded()
+    counters = await read_store(DATABASE.stats_counters)
+    total = int(counters.get("total", 0))
+    high = int(counters.get("risk:High", 0))
+    medium = int(counters.get("risk:Medium", 0))
+    low = int(counters.get("risk:Low", 0))
+    avg_score = counters.get("score_sum", 0) / total if total > 0 else 0
     return {
         "total_applicants": total,
         "active_defaults": high,
         "high_risk_percentage": f"{int((high/total)*100)}%" if total > 0 else "0%",
         "risk_distribution": {"high": high, "medium": medium, "low": low},
-        "average_apex_score": round(avg_score, 1)
+        "average_apex_score": round(avg_score, 1),
+        "score_histogram": {
+            f"{i * SCORE_BUCKET_WIDTH}-{i * SCORE_BUCKET_WIDTH + SCORE_BUCKET_WIDTH - 1}": int(counters.get(f"hist:{i}", 0))
+            for i in range(SCORE_BUCKETS)
+        },
+        "by_country": {k.split(":", 1)[1]: int(v) for k, v in counters.items() if k.startswith("country:") and v},
+        "by_decision": {k.split(":", 1)[1]: int(v) for k, v in counters.items() if k.startswith("decision:") and v}
     }
 
-@app.get("/api/applicant/{id}/financial-profile")
-def get_financial_profile(id: str):
-    applicant = DATABASE.get(id)
-    if not applicant:
-        raise HTTPException(status_code=404, detail="Applicant not found")
+# Bulk scoring of caller-supplied profiles. Records are validated one by one so a bad record
+# yields an error line instead of failing the batch; valid ones are scored SCORE_CHUNK_SIZE at a
+# time on the generation executor and streamed back as NDJSON in input order. NDJSON lines are
+# decoded a chunk at a time as the response streams, so a line that is not JSON is one more error
+# line. Amounts and loan counts are bounded so per-applicant sums stay exact in the
+# float64/int64 batch arithmetic.
+SCORE_CHUNK_SIZE = 500
+SCORE_MAX_RECORDS = 100000
+SCORE_MAX_AMOUNT = 10**12
+SCORE_MAX_LOANS = 1000
+
+class ScoreLoan(BaseModel):
+    status: Literal["Paid On Time", "Paid Early", "Paid Late", "Defaulted", "Restructured", "Active"]
+    amount: int = Field(ge=0, le=SCORE_MAX_AMOUNT)
+    repayment_amount: int | None = Field(None, ge=0, le=SCORE_MAX_AMOUNT)
+
+class ScoreBSI(BaseModel):
+    location_consistency: int = Field(ge=0, le=100)
+    device_stability: int = Field(ge=0, le=100)
+    sim_changes: int = Field(ge=0, le=100)
+
+class ScoreProfile(BaseModel):
+    id: str | None = None
+    loan_history: list[ScoreLoan] = Field(default_factory=list, max_length=SCORE_MAX_LOANS)
+    outstanding_debt: int | None = Field(None, ge=0, le=SCORE_MAX_LOANS * SCORE_MAX_AMOUNT)
+    bsi: ScoreBSI
+    currency_symbol: str = ""
+
+class RecordError:
+    """Stands in for a record that never reached validation, reported as an error at its index."""
+    __slots__ = ("type", "msg")
+
+    def __init__(self, type, msg):
+        self.type = type
+        self.msg = msg
+
+def score_profiles(chunk):
+    """Score a list of (index, raw record) pairs, returning one result dict per pair."""
+    with stage("score.batch"):
+        return _score_profiles(chunk)
+
+def _score_profiles(chunk):
+    results = {}
+    profiles = []
+    for index, record in chunk:
+        if isinstance(record, RecordError):
+            results[index] = {"index": index, "error": [{"type": record.type, "loc": [], "msg": record.msg}]}
+            continue
+        try:
+            profile = ScoreProfile.model_validate(record)
+        except ValidationError as exc:
+            results[index] = {"index": index, "error": exc.errors(include_url=False, include_context=False)}
+            continue
+        profiles.append((index, profile, [loan.model_dump() for loan in profile.loan_history]))
+
+    if profiles:
+        histories = [history for _, _, history in profiles]
+        loans = encode_loan_histories(histories)
+        counts = batch_status_counts(loans)
+        outstanding = np.array([
+            p.outstanding_debt if p.outstanding_debt is not None else counts["outstanding_debt"][i]
+            for i, (_, p, _) in enumerate(profiles)
+        ], dtype=np.int64)
+        apex_scores = batch_calculate_apex_scores(
+            [p.bsi.location_consistency for _, p, _ in profiles],
+            [p.bsi.device_stability for _, p, _ in profiles],
+            [p.bsi.sim_changes for _, p, _ in profiles],
+            outstanding,
+            loans,
+            counts,
+        )
+        for (index, profile, history), apex_score, debt in zip(profiles, apex_scores.tolist(), outstanding.tolist()):
+            bsi = profile.bsi
+            results[index] = {
+                "index": index,
+                "id": profile.id,
+                "apex_score": apex_score,
+                "risk_level": risk_level_for(apex_score),
+                "outstanding_debt": debt,
+                "recommendation": generate_ai_recommendation(
+                    apex_score, debt, history, bsi.location_consistency, bsi.device_stability,
+                    bsi.sim_changes, profile.currency_symbol, LoanSummary(history)
+                )
+            }
+    return [results[index] for index, _ in chunk]
+
+def iter_lines(body):
+    start = 0
+    while start < len(body):
+        end = body.find(b"\n", start)
+        if end == -1:
+            end = len(body)
+        yield body[start:end]
+        start = end + 1
+
+def ndjson_chunks(body):
+    chunk = []
+    for index, line in enumerate(line for line in iter_lines(body) if line.strip()):
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError as exc:
+            record = RecordError("json_invalid", f"Invalid JSON: {exc}")
+        chunk.append((index, record))
+        if len(chunk) == SCORE_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def array_chunks(records):
+    for start in range(0, len(records), SCORE_CHUNK_SIZE):
+        yield list(enumerate(records[start:start + SCORE_CHUNK_SIZE], start))
+
+@app.post("/api/score")
+async def score(request: Request):
+    body = await request.body()
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" in content_type or "jsonl" in content_type:
+        # Lines are only counted here; each is decoded when its chunk is scored
+        count = sum(1 for line in iter_lines(body) if line.strip())
+        chunks = ndjson_chunks(body)
+    else:
+        try:
+            records = orjson.loads(body)
+        except orjson.JSONDecodeError as exc:
+            raise HTTPException(status_code=400, detail=f"Invalid request body: {exc}")
+        if not isinstance(records, list):
+            raise HTTPException(status_code=400, detail="Invalid request body: expected a JSON array of profiles")
+        count = len(records)
+        chunks = array_chunks(records)
+    if count > SCORE_MAX_RECORDS:
+        raise HTTPException(status_code=413, detail=f"At most {SCORE_MAX_RECORDS} profiles per request")
+
+    # One slot is reserved for the whole stream before the response starts, so backpressure is a
+    # clean 503 rather than a failure partway through the body
+    release = reserve_generation()
+
+    async def stream():
+        try:
+            for chunk in chunks:
+                results = await asyncio.wrap_future(GENERATION_EXECUTOR.submit(score_profiles, chunk))
+                yield b"".join(orjson.dumps(result) + b"\n" for result in results)
+        finally:
+            release()
+
+    results = stream()
+    # A stream cancelled before its first chunk never enters its finally block
+    weakref.finalize(results, release)
+    return StreamingResponse(results, media_type="application/x-ndjson")
+
+# Streaming export of the whole book. The store is read a page at a time, so memory stays flat
+# however many applicants there are. rows=loans emits one row per loan, with the applicant's
+# columns repeated; in that mode "loan."-prefixed fields= paths select the loan columns. CSV and
+# Parquet columns come from the requested paths laid over the generator's record shape, never from
+# whichever record happens to be first, so a record missing a block just leaves its cells empty.
+EXPORT_PAGE_SIZE = 500
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv", "parquet": "application/vnd.apache.parquet"}
+
+def flatten(value, prefix="", out=None):
+    out = {} if out is None else out
+    for key, item in value.items():
+        name = f"{prefix}{key}"
+        if isinstance(item, dict):
+            flatten(item, f"{name}.", out)
+        elif isinstance(item, list):
+            out[name] = orjson.dumps(item).decode()
+        else:
+            out[name] = item
+    return out
+
+def export_rows(applicants, paths, rows):
+    if rows == "applicants":
+        for applicant in applicants:
+            yield project(applicant, paths)
+        return
+    applicant_paths = [p for p in paths if p[0] != "loan"] if paths else None
+    loan_paths = [p[1:] for p in paths if p[0] == "loan" and len(p) > 1] if paths else []
+    for applicant in applicants:
+        loans = applicant["tfd"]["loan_history"]
+        base = dict(applicant, tfd={k: v for k, v in applicant["tfd"].items() if k != "loan_history"})
+        base = flatten(project(base, applicant_paths))
+        for loan in loans:
+            row = dict(base)
+            row.update(flatten(project(loan, loan_paths or None), "loan."))
+            yield row
+
+_EXPORT_TEMPLATE = []
+
+def export_template():
+    """A generated applicant with one loan whose optional fields are filled: the export schema."""
+    if not _EXPORT_TEMPLATE:
+        generator = ApplicantGenerator(0, FixedClock(CORPUS_EPOCH))
+        applicant = generator.applicant()
+        while not applicant["tfd"]["loan_history"]:
+            applicant = generator.applicant()
+        loan = applicant["tfd"]["loan_history"][0]
+        applicant["tfd"]["loan_history"] = [dict(loan, days_overdue=0, repayment_amount=0)]
+        _EXPORT_TEMPLATE.append(applicant)
+    return _EXPORT_TEMPLATE[0]
+
+def _columns(record, paths, prefix=""):
+    if paths is None:
+        return list(flatten(record, prefix))
+    columns = []
+    for path in paths:
+        columns.extend(flatten(project(record, [path]), prefix) or [prefix + ".".join(path)])
+    return columns
+
+def export_columns(paths, rows):
+    """Flat column names for an export; paths outside the known shape keep a column of their own."""
+    template = export_template()
+    if rows == "applicants":
+        columns = _columns(template, paths)
+    else:
+        base = dict(template, tfd={k: v for k, v in template["tfd"].items() if k != "loan_history"})
+        applicant_paths = [p for p in paths if p[0] != "loan"] if paths else None
+        loan_paths = [p[1:] for p in paths if p[0] == "loan" and len(p) > 1] if paths else []
+        columns = _columns(base, applicant_paths) + _columns(template["tfd"]["loan_history"][0], loan_paths or None, "loan.")
+    return list(dict.fromkeys(columns))
+
+def flat_rows(applicants, paths, rows):
+    for row in export_rows(applicants, paths, rows):
+        yield flatten(row) if rows == "applicants" else row
+
+async def iter_store_pages():
+    after = 0
+    while True:
+        applicants, next_after = await read_store(DATABASE.page, after, EXPORT_PAGE_SIZE)
+        if applicants:
+            yield await read_scored(applicants)
+        if next_after is None:
+            return
+        after = next_after
+
+async def export_ndjson(paths, rows):
+    async for page in iter_store_pages():
+        with stage("serialize.export"):
+            chunk = b"".join(orjson.dumps(row) + b"\n" for row in export_rows(page, paths, rows))
+        yield chunk
+
+async def export_csv(paths, rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=export_columns(paths, rows), extrasaction="ignore", restval="")
+    writer.writeheader()
+    async for page in iter_store_pages():
+        writer.writerows(flat_rows(page, paths, rows))
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue().encode()
+
+class _DrainingSink(io.RawIOBase):
+    """Write-only file that hands its bytes out as they arrive but keeps absolute tell() offsets."""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+async def export_parquet(paths, rows):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = export_columns(paths, rows)
+    # Column types come from the template too; columns outside its shape are strings
+    known = pa.Table.from_pylist(list(flat_rows([export_template()], None, rows))).schema
+    schema = pa.schema([known.field(c) if c in known.names else pa.field(c, pa.string()) for c in columns])
+    loose = [c for c in columns if c not in known.names]
+    sink = _DrainingSink()
+    # Opened before the first page, so an empty store still yields a valid file with the schema
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        async for page in iter_store_pages():
+            batch = list(flat_rows(page, paths, rows))
+            for row in batch:
+                for column in loose:
+                    value = row.get(column)
+                    if value is not None and not isinstance(value, str):
+                        row[column] = orjson.dumps(value).decode()
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+@app.get("/api/export")
+async def export(format: Literal["ndjson", "csv", "parquet"] = "ndjson", rows: Literal["applicants", "loans"] = "applicants", fields: str = None):
+    await wait_seeded()
+    paths = parse_fields(fields)
+    if format == "parquet":
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise HTTPException(status_code=501, detail="Parquet export requires pyarrow to be installed")
+        body = export_parquet(paths, rows)
+    elif format == "csv":
+        body = export_csv(paths, rows)
+    else:
+        body = export_ndjson(paths, rows)
+    filename = f"applicants{'-loans' if rows == 'loans' else ''}.{format}"
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[format],
+                             headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
+# Per-applicant report views are rendered once with orjson and cached as the bytes either side of
+# the timestamp, which is the only part that changes between requests. Keys carry the record's
+# store version, so a rewrite by any process sharing the store is a miss; superseded entries are
+# never read again and age out of the LRU.
+REPORT_CACHE = OrderedDict()
+REPORT_CACHE_SIZE = int(os.environ.get("APEXSCORE_REPORT_CACHE_SIZE", "10000"))
+REPORT_CACHE_LOCK = threading.Lock()
+_TIMESTAMP_SENTINEL = "__apexscore_timestamp__"
+
+def financial_profile_view(applicant):
     return {
-        "applicant_id": id,
+        "applicant_id": applicant["id"],
         "name": applicant["name"]["full"],
         "financial_profile": applicant.get("financial_profile"),
-        "retrieved_at": datetime.datetime.utcnow().isoformat()
+        "retrieved_at": _TIMESTAMP_SENTINEL
     }
 
-@app.get("/api/applicant/{id}/credit-report")
-def get_credit_report(id: str):
-    applicant = DATABASE.get(id)
-    if not applicant:
-        raise HTTPException(status_code=404, detail="Applicant not found")
+def credit_report_view(applicant):
     return {
-        "applicant_id": id,
+        "applicant_id": applicant["id"],
         "name": applicant["name"]["full"],
         "credit_report": applicant.get("credit_report"),
         "financial_profile": applicant.get("financial_profile"),
         "outstanding_debt": applicant["tfd"]["outstanding_debt"],
-        "retrieved_at": datetime.datetime.utcnow().isoformat()
-        }
+        "retrieved_at": _TIMESTAMP_SENTINEL
+    }
 
-@app.get("/api/applicant/{id}/full-report")
-def get_full_report(id: str):
-    applicant = DATABASE.get(id)
-    if not applicant:
-        raise HTTPException(status_code=404, detail="Applicant not found")
+def full_report_view(applicant):
     return {
-        "applicant_id": id,
+        "applicant_id": applicant["id"],
         "personal_info": {
             "name": applicant["name"],
             "email": applicant["email"],
@@ -498,5 +2298,125 @@ def get_full_report(id: str):
         "apex_score": applicant["apex_score"],
         "risk_level": applicant["risk_level"],
         "recommendation": applicant["action_recommendation"],
-        "report_generated_at": datetime.datetime.utcnow().isoformat()
+        "report_generated_at": _TIMESTAMP_SENTINEL
     }
+
+async def render_report(applicant_id, view, build, if_none_match=None):
+    version = await read_store(DATABASE.version, applicant_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Applicant not found")
+    etag = etag_for(view, applicant_id, version)
+    cached = not_modified(if_none_match, etag)
+    if cached is not None:
+        return cached
+    key = (applicant_id, view, version)
+    with REPORT_CACHE_LOCK:
+        parts = REPORT_CACHE.get(key)
+        if parts is not None:
+            REPORT_CACHE.move_to_end(key)
+    count_cache("report", parts is not None)
+    if parts is None:
+        applicant = await read_store(DATABASE.get, applicant_id)
+        if not applicant:
+            raise HTTPException(status_code=404, detail="Applicant not found")
+        applicant = (await read_scored([applicant]))[0]
+        with stage("serialize.report"):
+            parts = tuple(orjson.dumps(build(applicant)).split(orjson.dumps(_TIMESTAMP_SENTINEL), 1))
+        with REPORT_CACHE_LOCK:
+            REPORT_CACHE[key] = parts
+            if len(REPORT_CACHE) > REPORT_CACHE_SIZE:
+                REPORT_CACHE.popitem(last=False)
+    timestamp = orjson.dumps(datetime.datetime.utcnow().isoformat())
+    response = Response(content=parts[0] + timestamp + parts[1], media_type="application/json")
+    set_etag(response, etag)
+    return response
+
+@app.get("/api/applicant/{id}/financial-profile")
+async def get_financial_profile(id: str, request: Request):
+    return await render_report(id, "financial-profile", financial_profile_view, request.headers.get("if-none-match"))
+
+@app.get("/api/applicant/{id}/credit-report")
+async def get_credit_report(id: str, request: Request):
+    return await render_report(id, "credit-report", credit_report_view, request.headers.get("if-none-match"))
+
+@app.get("/api/applicant/{id}/full-report")
+async def get_full_report(id: str, request: Request):
+    return await render_report(id, "full-report", full_report_view, request.headers.get("if-none-match"))
+
+# Reproducible benchmark corpus: applicants from ApplicantGenerator(seed) with a fixed clock,
+# cached as NDJSON under APEXSCORE_CORPUS_DIR so each size is generated once per seed. The
+# pytest-benchmark suite in tests/benchmarks runs on it.
+CORPUS_EPOCH = datetime.datetime(2025, 1, 1)
+CORPUS_DIR = os.environ.get("APEXSCORE_CORPUS_DIR", ".bench")
+
+def corpus_path(size, seed=0):
+    return os.path.join(CORPUS_DIR, f"corpus-{size}-seed{seed}.ndjson")
+
+def build_corpus(size, seed=0, workers=None):
+    path = corpus_path(size, seed)
+    os.makedirs(CORPUS_DIR, exist_ok=True)
+    with open(path + ".tmp", "wb") as out:
+        for batch in generate_applicants_bulk(size, seed=seed, workers=workers, clock=FixedClock(CORPUS_EPOCH)):
+            out.write(b"".join(orjson.dumps(applicant) + b"\n" for applicant in batch))
+    os.replace(path + ".tmp", path)
+    return path
+
+def iter_corpus(size, seed=0, workers=None):
+    path = corpus_path(size, seed)
+    if not os.path.exists(path):
+        build_corpus(size, seed, workers)
+    with open(path, "rb") as f:
+        for line in f:
+            yield orjson.loads(line)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ApexScore command line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="generate applicants as NDJSON")
+    generate.add_argument("count", type=int, help="number of applicants to generate")
+    generate.add_argument("--seed", type=int, default=None)
+    generate.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    generate.add_argument("--output", "-o", default="-", help="NDJSON output path, '-' for stdout")
+
+    corpus = commands.add_parser("corpus", help="build the reproducible benchmark corpus")
+    corpus.add_argument("size", type=int, nargs="+", help="corpus sizes, e.g. 1000 100000 1000000")
+    corpus.add_argument("--seed", type=int, default=0)
+    corpus.add_argument("--workers", type=int, default=None)
+
+    commands.add_parser("rescore", help="re-score stored records scored under older rules (SQLite store)")
+    args = parser.parse_args(argv)
+
+    if args.command == "corpus":
+        for size in args.size:
+            started = time.perf_counter()
+            path = build_corpus(size, args.seed, args.workers)
+            print(f"wrote {path} in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+        return
+    if args.command == "rescore":
+        started = time.perf_counter()
+        rescored = rescore_stale()
+        print(f"rescored {rescored} of {RESCORE_STATE['scanned']} applicants in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+        return
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    started = time.perf_counter()
+    written = 0
+    try:
+        for batch in generate_applicants_bulk(args.count, seed=args.seed, workers=args.workers):
+            for applicant in batch:
+                out.write(json.dumps(applicant) + "\n")
+            written += len(batch)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - started
+    print(f"generated {written} applicants in {elapsed:.2f}s ({written / elapsed:.0f}/s)", file=sys.stderr)
+
+# Pool workers and the CLI build their own data; only the served app seeds itself. This runs last
+# so eager seeding and the re-scoring sweep it may start see every definition above.
+if __name__ != "__main__" and not in_worker_process():
+    start_seeding()
+
+if __name__ == "__main__":
+    main()
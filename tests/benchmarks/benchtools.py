@@ -0,0 +1,37 @@
+"""Corpus and scratch-store helpers shared by the benchmark modules and their fixtures."""
+import contextlib
+import os
+import threading
+
+import pytest
+
+import main
+
+BENCH_SIZE = int(os.environ.get("APEXSCORE_BENCH_SIZE", "1000"))
+BENCH_SEED = int(os.environ.get("APEXSCORE_BENCH_SEED", "0"))
+# Per-call benchmarks cycle through this many corpus records per round
+BENCH_SAMPLE = int(os.environ.get("APEXSCORE_BENCH_SAMPLE", "200"))
+
+
+@contextlib.contextmanager
+def scratch_store(path):
+    """Serve from a fresh store at `path` inside the block, then restore the real one."""
+    seeded = threading.Event()
+    seeded.set()
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(main, "DATABASE", main.make_store(str(path)))
+        # The corpus stands in for startup seeding, so routes must not seed the scratch store
+        patch.setattr(main, "_SEEDED", seeded)
+        main.REPORT_CACHE.clear()
+        main.LOAN_SUMMARIES.clear()
+        try:
+            yield main.DATABASE
+        finally:
+            main.REPORT_CACHE.clear()
+            main.LOAN_SUMMARIES.clear()
+
+
+def load_corpus(size=BENCH_SIZE):
+    # Fresh dicts from disk, so stored records never alias the shared `corpus` fixture
+    for applicant in main.iter_corpus(size, BENCH_SEED):
+        main.save_applicant(applicant)
@@ -0,0 +1,45 @@
+"""Fixtures for the pytest-benchmark suite, which runs on the seeded corpus from main.iter_corpus.
+
+APEXSCORE_BENCH_SIZE picks the corpus size (1000 by default; 100000 and 1000000 for the full book)
+and APEXSCORE_STORE the backend under test. Each store here is a scratch one in a temporary
+directory, swapped in for main.DATABASE and swapped back afterwards.
+
+    python -m pytest tests/benchmarks --benchmark-only
+    APEXSCORE_BENCH_SIZE=100000 python -m pytest tests/benchmarks --benchmark-only --benchmark-autosave
+"""
+import asyncio
+import random
+
+import pytest
+
+import main
+from benchtools import BENCH_SAMPLE, BENCH_SEED, BENCH_SIZE, load_corpus, scratch_store
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    collect_ignore_glob = ["test_*.py"]
+
+
+@pytest.fixture(scope="session")
+def corpus():
+    return list(main.iter_corpus(BENCH_SIZE, BENCH_SEED))
+
+
+@pytest.fixture(scope="session")
+def picks(corpus):
+    return random.Random(BENCH_SEED).sample(corpus, min(BENCH_SAMPLE, len(corpus)))
+
+
+@pytest.fixture(scope="module")
+def loaded_store(tmp_path_factory):
+    with scratch_store(tmp_path_factory.mktemp("store") / "bench.db") as store:
+        load_corpus()
+        yield store
+
+
+@pytest.fixture(scope="session")
+def run():
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
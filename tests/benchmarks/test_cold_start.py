@@ -0,0 +1,66 @@
+import itertools
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import main
+from benchtools import BENCH_SEED
+
+SEED_COUNT = int(os.environ.get("APEXSCORE_BENCH_SEED_COUNT", "150"))
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Runs in a fresh interpreter: import main, then serve `/` and the first page index.html asks for,
+# timing each from before the import
+CHILD = """
+import json, time
+started = time.perf_counter()
+import main
+from fastapi.testclient import TestClient
+client = TestClient(main.app)
+assert client.get("/").status_code == 200
+ready = time.perf_counter() - started
+assert client.get("/api/applicants", params={"limit": 40}).status_code == 200
+print(json.dumps({"ready": ready, "first_page": time.perf_counter() - started}))
+"""
+
+# Snapshot loads eagerly, so it compares directly with generating the same records eagerly
+MODES = {
+    "eager": {"APEXSCORE_STARTUP": "eager"},
+    "background": {"APEXSCORE_STARTUP": "background"},
+    "lazy": {"APEXSCORE_STARTUP": "lazy"},
+    "snapshot": {"APEXSCORE_STARTUP": "eager"},
+}
+
+
+@pytest.fixture(scope="module")
+def snapshot(tmp_path_factory):
+    path = tmp_path_factory.mktemp("snapshot") / "snapshot.ndjson"
+    with open(path, "wb") as out:
+        for applicant in itertools.islice(main.iter_corpus(max(SEED_COUNT, 1), BENCH_SEED), SEED_COUNT):
+            out.write(json.dumps(applicant).encode() + b"\n")
+    return str(path)
+
+
+@pytest.mark.benchmark(group="cold-start")
+@pytest.mark.parametrize("mode", list(MODES))
+def test_cold_start(benchmark, mode, snapshot, tmp_path):
+    """Process start to the first `/` response; extra_info also has the time to the first page."""
+    rounds = itertools.count()
+    env = dict(os.environ, PYTHONPATH=ROOT, APEXSCORE_SEED_COUNT=str(SEED_COUNT), **MODES[mode])
+    env.pop("APEXSCORE_SNAPSHOT", None)
+    if mode == "snapshot":
+        env["APEXSCORE_SNAPSHOT"] = snapshot
+
+    def start():
+        # A fresh SQLite file per start, so every run begins from an empty store
+        env["APEXSCORE_DB_PATH"] = str(tmp_path / f"cold-{next(rounds)}.db")
+        out = subprocess.run([sys.executable, "-c", CHILD], env=env, cwd=str(tmp_path), check=True,
+                             capture_output=True, text=True).stdout
+        return json.loads(out.strip().splitlines()[-1])
+
+    timings = benchmark.pedantic(start, rounds=3, iterations=1)
+    benchmark.extra_info.update(mode=mode, seed_count=SEED_COUNT,
+                                ready_seconds=round(timings["ready"], 4), first_page_seconds=round(timings["first_page"], 4))
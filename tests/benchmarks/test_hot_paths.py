@@ -0,0 +1,66 @@
+import contextlib
+import itertools
+
+import main
+from benchtools import BENCH_SEED, load_corpus, scratch_store
+
+
+def scalar_score(applicant):
+    return main.calculate_apex_score(
+        applicant["bsi"]["location_consistency"],
+        applicant["bsi"]["device_stability"],
+        applicant["bsi"]["sim_changes"],
+        applicant["tfd"]["outstanding_debt"],
+        applicant["tfd"]["loan_history"],
+    )
+
+
+def test_generate_applicant(benchmark):
+    generator = main.ApplicantGenerator(BENCH_SEED, main.FixedClock(main.CORPUS_EPOCH))
+    benchmark(generator.applicant)
+
+
+def test_store_load(benchmark, tmp_path):
+    rounds = itertools.count()
+    with contextlib.ExitStack() as stores:
+        def fresh_store():
+            stores.enter_context(scratch_store(tmp_path / f"load-{next(rounds)}.db"))
+
+        benchmark.pedantic(load_corpus, setup=fresh_store, rounds=3, iterations=1)
+
+
+def test_score_scalar(benchmark, picks):
+    benchmark(lambda: [scalar_score(a) for a in picks])
+
+
+def test_score_batch(benchmark, corpus):
+    benchmark(main.batch_score_applicants, corpus)
+
+
+def test_search_hit(benchmark, loaded_store, picks, run):
+    async def lookups():
+        for applicant in picks:
+            await main.search(applicant["email"])
+
+    benchmark(lambda: run(lookups()))
+
+
+def test_stats(benchmark, loaded_store, run):
+    benchmark(lambda: run(main.stats()))
+
+
+def render_reports(run, picks):
+    async def renders():
+        for applicant in picks:
+            await main.render_report(applicant["id"], "full-report", main.full_report_view)
+
+    run(renders())
+
+
+def test_report_full_cold(benchmark, loaded_store, picks, run):
+    benchmark.pedantic(render_reports, args=(run, picks), setup=main.REPORT_CACHE.clear, rounds=5, iterations=1)
+
+
+def test_report_full_warm(benchmark, loaded_store, picks, run):
+    render_reports(run, picks)
+    benchmark(render_reports, run, picks)
@@ -0,0 +1,65 @@
+import gc
+import os
+import random
+import tracemalloc
+
+import orjson
+import pytest
+
+import main
+from benchtools import BENCH_SAMPLE, BENCH_SEED, BENCH_SIZE
+
+BACKENDS = {"dict": main.MemoryStore, "compact": main.CompactStore}
+
+
+def corpus_lines():
+    path = main.corpus_path(BENCH_SIZE, BENCH_SEED)
+    if not os.path.exists(path):
+        main.build_corpus(BENCH_SIZE, BENCH_SEED)
+    with open(path, "rb") as f:
+        return f.read().splitlines()
+
+
+def filled(backend, lines):
+    """A store of `backend` holding the corpus, and the bytes it retains per applicant."""
+    main._build_vocab()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        store = BACKENDS[backend]()
+        # Records are decoded inside the trace, so everything the store keeps is counted once
+        for line in lines:
+            store.save(orjson.loads(line))
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return store, retained / len(lines)
+
+
+@pytest.fixture(scope="module")
+def lines():
+    return corpus_lines()
+
+
+@pytest.fixture(scope="module", params=sorted(BACKENDS))
+def sized(request, lines):
+    return (request.param,) + filled(request.param, lines)
+
+
+@pytest.mark.benchmark(group="store-memory")
+def test_bytes_per_applicant(benchmark, sized, lines):
+    """Retained bytes per applicant go in extra_info (see --benchmark-json); the timed part is reads,
+    the price CompactStore pays for its size."""
+    backend, store, per_applicant = sized
+    benchmark.extra_info["backend"] = backend
+    benchmark.extra_info["bytes_per_applicant"] = round(per_applicant)
+    ids = [orjson.loads(line)["id"] for line in random.Random(BENCH_SEED).sample(lines, min(BENCH_SAMPLE, len(lines)))]
+    benchmark(lambda: [store.get(i) for i in ids])
+
+
+def test_compact_store_is_smaller(lines):
+    _, dict_bytes = filled("dict", lines)
+    _, compact_bytes = filled("compact", lines)
+    assert compact_bytes < dict_bytes
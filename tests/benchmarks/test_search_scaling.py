@@ -0,0 +1,36 @@
+import os
+import random
+
+import pytest
+
+import main
+from benchtools import BENCH_SAMPLE, BENCH_SEED, scratch_store
+
+# Store sizes for the lookup benchmark; add 1000000 to check the full range
+LOOKUP_SIZES = [int(size) for size in os.environ.get("APEXSCORE_BENCH_LOOKUP_SIZES", "1000,10000,100000").split(",")]
+
+
+@pytest.fixture(scope="module", params=LOOKUP_SIZES, ids=lambda size: f"{size}-records")
+def sized_store(request, tmp_path_factory):
+    # Copies of one generated record under distinct ids and emails: the email index and the
+    # store lookups are what grow with the size, not the per-record work
+    template = main.ApplicantGenerator(BENCH_SEED, main.FixedClock(main.CORPUS_EPOCH)).applicant()
+    with scratch_store(tmp_path_factory.mktemp("lookup") / "bench.db") as store:
+        for i in range(request.param):
+            store.save(dict(template, id=f"lookup-{i}", email=f"lookup{i}@gmail.com"))
+        yield request.param
+
+
+@pytest.mark.benchmark(group="search-lookup")
+def test_search_lookup_latency(benchmark, sized_store, run):
+    """/api/search hits for existing emails; the mean per round should stay flat across sizes."""
+    picks = random.Random(BENCH_SEED).sample(range(sized_store), min(BENCH_SAMPLE, sized_store))
+    # Mixed case, as callers send it, so normalization is part of the measured path
+    emails = [f"Lookup{i}@GMAIL.com" for i in picks]
+
+    async def lookups():
+        return [(await main.search(email))["id"] for email in emails]
+
+    assert run(lookups()) == [f"lookup-{i}" for i in picks]
+    benchmark.extra_info["records"] = sized_store
+    benchmark(lambda: run(lookups()))
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# main.py reads its configuration at import time: keep the store in memory and skip startup seeding
+os.environ.setdefault("APEXSCORE_STORE", "memory")
+os.environ.setdefault("APEXSCORE_STARTUP", "lazy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
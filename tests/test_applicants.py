@@ -0,0 +1,45 @@
+import datetime
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+CLOCK = lambda: datetime.datetime(2025, 1, 1)
+
+client = TestClient(main.app)
+
+
+@pytest.fixture
+def store(monkeypatch):
+    seeded = threading.Event()
+    seeded.set()
+    monkeypatch.setattr(main, "DATABASE", main.MemoryStore())
+    monkeypatch.setattr(main, "_SEEDED", seeded)
+    monkeypatch.setattr(main, "PAGE_LIMIT_MAX", 10)
+    generator = main.ApplicantGenerator(51, CLOCK)
+    return [main.save_applicant(generator.applicant())["id"] for _ in range(25)]
+
+
+@pytest.mark.parametrize("filters", [{}, {"sort": "apex_score"}])
+def test_oversized_limit_is_clamped_and_paged(store, filters):
+    seen = []
+    params = dict(filters, limit=5000)
+    while True:
+        response = client.get("/api/applicants", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["applicants"]) <= 10
+        seen.extend(a["id"] for a in page["applicants"])
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    assert sorted(seen) == sorted(store)
+    if not filters:
+        assert seen == store
+
+
+def test_negative_limit_is_still_rejected(store):
+    assert client.get("/api/applicants", params={"limit": -1}).status_code == 422
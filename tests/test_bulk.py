@@ -0,0 +1,57 @@
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+
+def test_bulk_rejects_more_workers_than_cpus():
+    response = client.post("/api/applicants/bulk", json={"count": 10, "workers": main.BULK_MAX_WORKERS + 1})
+    assert response.status_code == 422
+
+
+def test_bulk_caps_pool_size_at_cpu_count(monkeypatch):
+    sizes = []
+
+    class RecordingPool:
+        def __init__(self, max_workers, mp_context):
+            sizes.append(max_workers)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, fn, *args):
+            return map(fn, *args)
+
+    monkeypatch.setattr(main, "BULK_MAX_WORKERS", 2)
+    monkeypatch.setattr(main, "ProcessPoolExecutor", RecordingPool)
+    batches = list(main.generate_applicants_bulk(count=10 * main.BULK_CHUNK_SIZE, seed=1, workers=1000))
+
+    assert sizes == [2]
+    assert sum(len(batch) for batch in batches) == 10 * main.BULK_CHUNK_SIZE
+
+
+
+def test_repeated_seed_adds_new_applicants():
+    before = len(main.DATABASE)
+    first = client.post("/api/applicants/bulk", json={"count": 10, "seed": 5}).json()
+    second = client.post("/api/applicants/bulk", json={"count": 10, "seed": 5}).json()
+
+    assert first["inserted"] == second["inserted"] == 10
+    assert not set(first["ids"]) & set(second["ids"])
+    assert second["total_applicants"] == before + 20
+    # Everything but the id still follows the seed
+    names = [[main.DATABASE.get(i)["name"]["full"] for i in ids] for ids in (first["ids"], second["ids"])]
+    assert names[0] == names[1]
+
+
+def test_repeated_emails_are_skipped():
+    first = client.post("/api/applicants/bulk", json={"emails": ["bulk.alice@gmail.com", "bulk.bob@gmail.com"], "seed": 7}).json()
+    second = client.post("/api/applicants/bulk", json={"emails": ["Bulk.Alice@gmail.com", "bulk.carl@gmail.com"], "seed": 7}).json()
+
+    assert first["inserted"] == 2
+    assert second["inserted"] == 1
+    assert len(set(first["ids"]) | set(second["ids"])) == 3
@@ -0,0 +1,86 @@
+import csv
+import datetime
+import io
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+CLOCK = lambda: datetime.datetime(2025, 1, 1)
+
+client = TestClient(main.app)
+
+
+@pytest.fixture
+def store(monkeypatch):
+    seeded = threading.Event()
+    seeded.set()
+    monkeypatch.setattr(main, "DATABASE", main.MemoryStore())
+    monkeypatch.setattr(main, "_SEEDED", seeded)
+    return main.DATABASE
+
+
+def fill(count, seed=41):
+    generator = main.ApplicantGenerator(seed, CLOCK)
+    applicants = [generator.applicant() for _ in range(count)]
+    # An older record without the financial profile block comes first
+    del applicants[0]["financial_profile"]
+    for applicant in applicants:
+        main.save_applicant(applicant)
+    return applicants
+
+
+def read_csv(params):
+    response = client.get("/api/export", params=dict(params, format="csv"))
+    assert response.status_code == 200
+    return list(csv.DictReader(io.StringIO(response.text)))
+
+
+def test_csv_keeps_columns_missing_from_the_first_record(store):
+    applicants = fill(5)
+    rows = read_csv({})
+
+    assert len(rows) == 5
+    assert rows[0]["financial_profile.monthly_income"] == ""
+    assert rows[1]["financial_profile.monthly_income"] == str(applicants[1]["financial_profile"]["monthly_income"])
+
+
+def test_csv_header_follows_requested_fields(store):
+    applicants = fill(3)
+    rows = read_csv({"fields": "id,financial_profile.monthly_income,name,no.such.field"})
+
+    assert list(rows[0]) == ["id", "financial_profile.monthly_income", "name.first", "name.middle", "name.last", "name.full", "no.such.field"]
+    assert rows[0]["financial_profile.monthly_income"] == ""
+    assert rows[2]["financial_profile.monthly_income"] == str(applicants[2]["financial_profile"]["monthly_income"])
+    assert rows[2]["name.full"] == applicants[2]["name"]["full"]
+
+
+def test_csv_loan_rows(store):
+    applicants = fill(4)
+    rows = read_csv({"rows": "loans", "fields": "id,loan.status,loan.amount"})
+
+    assert len(rows) == sum(len(a["tfd"]["loan_history"]) for a in applicants)
+    assert rows and list(rows[0]) == ["id", "loan.status", "loan.amount"]
+
+
+def test_empty_store_exports_are_valid(store):
+    pq = pytest.importorskip("pyarrow.parquet")
+    table = pq.read_table(io.BytesIO(client.get("/api/export", params={"format": "parquet"}).content))
+    assert table.num_rows == 0
+    assert "apex_score" in table.column_names
+    assert read_csv({}) == []
+    assert "apex_score" in client.get("/api/export", params={"format": "csv"}).text.splitlines()[0]
+
+
+def test_parquet_keeps_columns_missing_from_the_first_record(store):
+    pq = pytest.importorskip("pyarrow.parquet")
+    applicants = fill(5)
+    response = client.get("/api/export", params={"format": "parquet", "fields": "id,financial_profile.monthly_income,extra.field"})
+    table = pq.read_table(io.BytesIO(response.content)).to_pylist()
+
+    assert [row["id"] for row in table] == [a["id"] for a in applicants]
+    assert table[0]["financial_profile.monthly_income"] is None
+    assert table[1]["financial_profile.monthly_income"] == applicants[1]["financial_profile"]["monthly_income"]
+    assert all(row["extra.field"] is None for row in table)
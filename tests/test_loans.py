@@ -0,0 +1,162 @@
+import datetime
+
+import pytest
+
+import main
+
+CLOCK = lambda: datetime.datetime(2025, 1, 1)
+
+
+@pytest.fixture
+def sqlite_store(tmp_path, monkeypatch):
+    store = main.SQLiteStore(str(tmp_path / "loans.db"))
+    monkeypatch.setattr(main, "DATABASE", store)
+    main.LOAN_SUMMARIES.clear()
+    yield store
+    main.LOAN_SUMMARIES.clear()
+
+
+def stored_applicant(seed=3):
+    generator = main.ApplicantGenerator(seed, CLOCK)
+    for _ in range(50):
+        applicant, summary = generator.build()
+        if any(loan["status"] in ("Paid On Time", "Paid Early") for loan in applicant["tfd"]["loan_history"]):
+            return main.save_applicant(applicant, summary)
+    raise AssertionError("no applicant with a loan paid on time")
+
+
+def test_summary_cache_misses_after_another_worker_rewrites_loans(sqlite_store, tmp_path):
+    applicant = stored_applicant()
+    assert applicant["id"] in main.LOAN_SUMMARIES
+
+    # Another worker on the same file turns a paid-on-time loan late and changes a repayment;
+    # neither shows in the loan count, debt, defaults or active count
+    other = main.SQLiteStore(str(tmp_path / "loans.db"))
+    record = other.get(applicant["id"])
+    loan = next(l for l in record["tfd"]["loan_history"] if l["status"] in ("Paid On Time", "Paid Early"))
+    loan["status"] = "Paid Late"
+    loan["repayment_amount"] = (loan["repayment_amount"] or 0) + 1234
+    other.save(record)
+
+    current, version = main.DATABASE.get_versioned(applicant["id"])
+    summary = main.get_loan_summary(current, version)
+    expected = main.LoanSummary(current["tfd"]["loan_history"])
+    for field in main.LoanSummary.__slots__:
+        assert getattr(summary, field) == getattr(expected, field), field
+
+
+def test_refresh_scores_uses_the_stored_loans(sqlite_store, tmp_path):
+    applicant = stored_applicant(seed=4)
+    other = main.SQLiteStore(str(tmp_path / "loans.db"))
+    record = other.get(applicant["id"])
+    for loan in record["tfd"]["loan_history"]:
+        if loan["status"] in ("Paid On Time", "Paid Early"):
+            loan["status"] = "Paid Late"
+    record["scoring_version"] = None
+    other.save(record)
+
+    [refreshed] = main.refresh_scores([main.DATABASE.get(applicant["id"])])
+    fresh = main.rescore_applicant(main.DATABASE.get(applicant["id"]), main.LoanSummary(record["tfd"]["loan_history"]))
+    assert refreshed["apex_score"] == fresh["apex_score"]
+    assert refreshed["action_recommendation"] == fresh["action_recommendation"]
+
+
+@pytest.fixture(params=["memory", "compact", "sqlite"])
+def any_store(request, tmp_path, monkeypatch):
+    monkeypatch.setenv("APEXSCORE_STORE", request.param)
+    store = main.make_store(str(tmp_path / "store.db"))
+    monkeypatch.setattr(main, "DATABASE", store)
+    main.LOAN_SUMMARIES.clear()
+    generator = main.ApplicantGenerator(31, CLOCK)
+    for _ in range(60):
+        main.generate_applicant(generator=generator)
+    yield store
+    main.LOAN_SUMMARIES.clear()
+
+
+def rebuilt(store, tmp_path):
+    """A store of the same backend holding the same records, so its counters and indexes are a recount."""
+    fresh = main.make_store(str(tmp_path / "recount.db"))
+    for applicant in store.values():
+        fresh.save(applicant)
+    return fresh
+
+
+def counters(store):
+    return {k: v for k, v in store.stats_counters().items() if k != "version" and v}
+
+
+QUERIES = [
+    {},
+    {"risk_level": "Low"},
+    {"risk_level": "High", "sort": "created_at"},
+    {"decision": "Approve", "descending": True},
+    {"min_score": 50, "max_score": 80},
+]
+
+
+def assert_matches_recount(store, applicant_id, summary, tmp_path):
+    applicant = store.get(applicant_id)
+    history = applicant["tfd"]["loan_history"]
+    expected = main.LoanSummary(history)
+    for field in main.LoanSummary.__slots__:
+        assert getattr(summary, field) == getattr(expected, field), field
+
+    assert applicant["tfd"]["outstanding_debt"] == expected.outstanding_debt
+    assert applicant["credit_report"]["active_credit_lines"] == expected.active_loans
+    assert applicant["credit_report"]["derogatory_marks"] == expected.defaults
+    assert applicant["credit_report"]["total_credit_accounts"] == len(applicant["bank_accounts"]) + expected.total_loans
+    bsi = applicant["bsi"]
+    assert applicant["apex_score"] == main.calculate_apex_score(
+        bsi["location_consistency"], bsi["device_stability"], bsi["sim_changes"], applicant["tfd"]["outstanding_debt"], history
+    )
+    assert applicant["risk_level"] == main.risk_level_for(applicant["apex_score"])
+
+    fresh = rebuilt(store, tmp_path)
+    assert counters(store) == counters(fresh)
+    for query in QUERIES:
+        found, _ = store.query(limit=1000, **query)
+        recounted, _ = fresh.query(limit=1000, **query)
+        assert [a["id"] for a in found] == [a["id"] for a in recounted], query
+
+
+def target(store):
+    return next(a for a in store.values() if a["tfd"]["loan_history"])
+
+
+def test_append_loan_matches_a_full_recount(any_store, tmp_path):
+    applicant = target(any_store)
+    loan = dict(applicant["tfd"]["loan_history"][0], loan_id="LN-0A1B2C3D", status="Defaulted",
+                amount=90000, days_overdue=120, repayment_amount=None)
+
+    summary = main.append_loan(applicant, loan)
+
+    assert loan in any_store.get(applicant["id"])["tfd"]["loan_history"]
+    assert_matches_recount(any_store, applicant["id"], summary, tmp_path)
+
+
+def test_update_loan_status_matches_a_full_recount(any_store, tmp_path):
+    applicant = target(any_store)
+    loan = applicant["tfd"]["loan_history"][-1]
+    status = "Paid Late" if loan["status"] != "Paid Late" else "Defaulted"
+
+    summary = main.update_loan_status(applicant, loan["loan_id"], status, 30, 1500)
+
+    stored = next(l for l in any_store.get(applicant["id"])["tfd"]["loan_history"] if l["loan_id"] == loan["loan_id"])
+    assert (stored["status"], stored["days_overdue"], stored["repayment_amount"]) == (status, 30, 1500)
+    assert_matches_recount(any_store, applicant["id"], summary, tmp_path)
+
+
+def test_repeated_edits_keep_matching_a_full_recount(any_store, tmp_path):
+    applicant = target(any_store)
+    for i, status in enumerate(["Active", "Paid On Time", "Restructured", "Defaulted", "Paid Early"]):
+        loan = dict(applicant["tfd"]["loan_history"][0], loan_id=f"LN-0000000{i}", status="Active",
+                    days_overdue=None, repayment_amount=None)
+        main.append_loan(applicant, loan)
+        summary = main.update_loan_status(applicant, loan["loan_id"], status, None, 1000 * i)
+    assert_matches_recount(any_store, applicant["id"], summary, tmp_path)
+
+
+def test_update_of_unknown_loan_raises(any_store):
+    with pytest.raises(KeyError):
+        main.update_loan_status(target(any_store), "LN-FFFFFFFF", "Paid Late")
@@ -0,0 +1,33 @@
+import threading
+
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+
+def test_slow_request_profiles_are_written_off_the_event_loop(monkeypatch):
+    dumps = []
+
+    def recording(route, started, finished):
+        dumps.append((route, threading.current_thread().name))
+
+    monkeypatch.setattr(main, "PROFILE_SLOW_MS", 1e-9)
+    monkeypatch.setattr(main, "dump_profile", recording)
+    assert client.get("/metrics").status_code == 200
+    main.PROFILE_WRITER.submit(lambda: None).result()
+
+    assert dumps and dumps[0][0] == "/metrics"
+    assert dumps[0][1].startswith("apexscore-profile")
+
+
+def test_dump_profile_writes_samples_from_the_request_window(monkeypatch, tmp_path):
+    monkeypatch.setattr(main, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(main, "PROFILE_SAMPLES", [(1.0, "a;b"), (2.0, "a;b"), (2.5, "a;c"), (9.0, "a;d")])
+
+    path = main.dump_profile("/api/applicant/{id}", 1.5, 3.0)
+
+    with open(path) as f:
+        assert sorted(f.read().splitlines()) == ["a;b 1", "a;c 1"]
+    assert "api_applicant_id" in path
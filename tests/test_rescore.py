@@ -0,0 +1,78 @@
+import asyncio
+import datetime
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+CLOCK = lambda: datetime.datetime(2025, 1, 1)
+
+client = TestClient(main.app)
+
+
+@pytest.fixture
+def store(monkeypatch):
+    seeded = threading.Event()
+    seeded.set()
+    monkeypatch.setattr(main, "DATABASE", main.MemoryStore())
+    monkeypatch.setattr(main, "_SEEDED", seeded)
+    return main.DATABASE
+
+
+def save_stale(applicants):
+    # As if scored under older rules: every record claims to be low risk with a top score
+    for applicant in applicants:
+        applicant["apex_score"] = 95
+        applicant["risk_level"] = "Low"
+        applicant["scoring_version"] = None
+        main.save_applicant(applicant)
+
+
+def test_filtered_page_matches_filter_after_rescoring(store):
+    generator = main.ApplicantGenerator(11, CLOCK)
+    applicants = [generator.applicant() for _ in range(200)]
+    truly_low = sum(main.risk_level_for(a["apex_score"]) == "Low" for a in applicants)
+    save_stale(applicants)
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"risk_level": "Low", "limit": 25}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/applicants", params=params).json()
+        seen.extend(page["applicants"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert all(a["risk_level"] == "Low" and a["apex_score"] >= 75 for a in seen)
+    assert 0 < len(seen) == len({a["id"] for a in seen}) == truly_low
+
+
+def test_min_score_filter_holds_after_rescoring(store):
+    generator = main.ApplicantGenerator(12, CLOCK)
+    save_stale([generator.applicant() for _ in range(100)])
+
+    page = client.get("/api/applicants", params={"min_score": 90, "limit": 100}).json()
+    assert all(a["apex_score"] >= 90 for a in page["applicants"])
+
+
+def test_stale_reads_rescore_off_the_event_loop(store, monkeypatch):
+    generator = main.ApplicantGenerator(13, CLOCK)
+    applicant = generator.applicant()
+    save_stale([applicant])
+    threads = []
+    refresh_scores = main.refresh_scores
+
+    def recording(applicants):
+        threads.append(threading.current_thread())
+        return refresh_scores(applicants)
+
+    monkeypatch.setattr(main, "refresh_scores", recording)
+    [refreshed] = asyncio.run(main.read_scored([store.get(applicant["id"])]))
+
+    assert threads and threads[0] is not threading.current_thread()
+    assert not main.is_stale(refreshed)
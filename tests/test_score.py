@@ -0,0 +1,53 @@
+import orjson
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+BSI = {"location_consistency": 80, "device_stability": 70, "sim_changes": 90}
+PROFILE = {"id": "p", "bsi": BSI, "loan_history": [{"status": "Active", "amount": 1000}, {"status": "Paid Late", "amount": 500}]}
+NDJSON = {"content-type": "application/x-ndjson"}
+
+
+def results(response):
+    assert response.status_code == 200
+    return [orjson.loads(line) for line in response.text.splitlines()]
+
+
+def test_malformed_ndjson_line_is_a_per_index_error():
+    body = orjson.dumps(PROFILE) + b"\n{not json\n" + orjson.dumps(PROFILE) + b"\n"
+    lines = results(client.post("/api/score", content=body, headers=NDJSON))
+
+    assert [line["index"] for line in lines] == [0, 1, 2]
+    assert lines[1]["error"][0]["type"] == "json_invalid"
+    assert lines[0]["apex_score"] == lines[2]["apex_score"]
+    assert "error" not in lines[0] and "error" not in lines[2]
+
+
+def test_ndjson_from_a_streamed_body_keeps_input_order():
+    body = b"".join(orjson.dumps(dict(PROFILE, id=str(i))) + b"\n" for i in range(1200))
+    pieces = (body[i:i + 777] for i in range(0, len(body), 777))
+    lines = results(client.post("/api/score", content=pieces, headers=NDJSON))
+
+    assert [line["id"] for line in lines] == [str(i) for i in range(1200)]
+    assert len({line["apex_score"] for line in lines}) == 1
+
+
+def test_ndjson_matches_json_array_scoring():
+    profiles = [PROFILE, {"bsi": BSI}, {"bsi": {}}, dict(PROFILE, loan_history=[{"status": "Defaulted", "amount": 90000}])]
+    body = b"\n".join(orjson.dumps(p) for p in profiles)
+
+    assert results(client.post("/api/score", content=body, headers=NDJSON)) == results(client.post("/api/score", json=profiles))
+
+
+def test_ndjson_record_limit_counts_lines(monkeypatch):
+    monkeypatch.setattr(main, "SCORE_MAX_RECORDS", 3)
+    body = b"\n\n".join(orjson.dumps(PROFILE) for _ in range(3)) + b"\n\n"
+    assert len(results(client.post("/api/score", content=body, headers=NDJSON))) == 3
+    assert client.post("/api/score", content=body + b"{}", headers=NDJSON).status_code == 413
+
+
+def test_invalid_json_array_is_rejected():
+    assert client.post("/api/score", content=b"[{", headers={"content-type": "application/json"}).status_code == 400
+    assert client.post("/api/score", json={"bsi": BSI}).status_code == 400
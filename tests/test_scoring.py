@@ -0,0 +1,49 @@
+import datetime
+
+import main
+
+CLOCK = lambda: datetime.datetime(2025, 1, 1)
+
+
+def seeded_applicants(count, seed=1234):
+    generator = main.ApplicantGenerator(seed, CLOCK)
+    return [generator.applicant() for _ in range(count)]
+
+
+def scalar_score(applicant):
+    return main.calculate_apex_score(
+        applicant["bsi"]["location_consistency"],
+        applicant["bsi"]["device_stability"],
+        applicant["bsi"]["sim_changes"],
+        applicant["tfd"]["outstanding_debt"],
+        applicant["tfd"]["loan_history"],
+    )
+
+
+def test_batch_scores_match_scalar_scores():
+    applicants = seeded_applicants(2000)
+    batch = main.batch_score_applicants(applicants)
+
+    assert [int(score) for score in batch["apex_score"]] == [scalar_score(a) for a in applicants]
+
+
+def test_batch_counts_match_loan_summaries():
+    applicants = seeded_applicants(500, seed=99)
+    counts = main.batch_status_counts(main.encode_loan_histories([a["tfd"]["loan_history"] for a in applicants]))
+
+    for i, applicant in enumerate(applicants):
+        summary = main.LoanSummary(applicant["tfd"]["loan_history"])
+        for field in ("total_loans", "paid_on_time", "paid_late", "defaults", "active_loans", "restructured", "outstanding_debt", "total_borrowed", "total_paid"):
+            assert int(counts[field][i]) == getattr(summary, field), (field, applicant["id"])
+
+
+def test_batch_scores_cover_edge_histories():
+    applicants = seeded_applicants(3, seed=7)
+    applicants[0]["tfd"]["loan_history"] = []
+    applicants[0]["tfd"]["outstanding_debt"] = 0
+    applicants[1]["tfd"]["outstanding_debt"] = 200000
+    for loan in applicants[2]["tfd"]["loan_history"]:
+        loan["status"] = "Defaulted"
+    batch = main.batch_score_applicants(applicants)
+
+    assert [int(score) for score in batch["apex_score"]] == [scalar_score(a) for a in applicants]
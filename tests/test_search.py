@@ -0,0 +1,42 @@
+import asyncio
+
+import httpx
+
+import main
+
+
+async def search_all(emails):
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://apexscore") as client:
+        return await asyncio.gather(*[client.get("/api/search", params={"email": email}) for email in emails])
+
+
+def test_concurrent_searches_for_a_new_email_create_one_applicant():
+    before = len(main.DATABASE)
+    # Case variants of one address all normalize to the same applicant
+    emails = [("Single.Flight@gmail.com", "single.flight@gmail.com", "SINGLE.FLIGHT@GMAIL.COM")[i % 3] for i in range(300)]
+    responses = asyncio.run(search_all(emails))
+
+    assert {r.status_code for r in responses} == {200}
+    assert len({r.json()["id"] for r in responses}) == 1
+    assert len(main.DATABASE) == before + 1
+    assert not main._SEARCH_INFLIGHT
+
+
+def test_concurrent_searches_for_distinct_emails_create_one_applicant_each():
+    before = len(main.DATABASE)
+    emails = [f"flight{i % 4}@yahoo.com" for i in range(200)]
+    responses = asyncio.run(search_all(emails))
+
+    ids = {}
+    for email, response in zip(emails, responses):
+        assert response.status_code == 200
+        ids.setdefault(email, set()).add(response.json()["id"])
+    assert all(len(found) == 1 for found in ids.values())
+    assert len({found.pop() for found in ids.values()}) == 4
+    assert len(main.DATABASE) == before + 4
+
+
+def test_search_rejects_invalid_email():
+    responses = asyncio.run(search_all(["not-an-email"]))
+    assert responses[0].status_code == 400
@@ -0,0 +1,50 @@
+import datetime
+import threading
+
+import orjson
+import pytest
+
+import main
+
+CLOCK = lambda: datetime.datetime(2025, 1, 1)
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    generator = main.ApplicantGenerator(21, CLOCK)
+    path = tmp_path / "snapshot.ndjson"
+    path.write_bytes(b"".join(orjson.dumps(generator.applicant()) + b"\n" for _ in range(30)))
+    return str(path)
+
+
+def start_worker(monkeypatch, store):
+    """Run seed_store() as a freshly started worker serving `store` would."""
+    monkeypatch.setattr(main, "DATABASE", store)
+    monkeypatch.setattr(main, "SEED_STATE", {"state": "pending", "started_at": None, "finished_at": None, "error": None})
+    monkeypatch.setattr(main, "_SEEDED", threading.Event())
+    main.seed_store()
+    assert main.SEED_STATE["state"] == "ready"
+
+
+def test_snapshot_is_loaded_once_per_shared_store(monkeypatch, tmp_path, snapshot):
+    monkeypatch.setattr(main, "SNAPSHOT_PATH", snapshot)
+    path = str(tmp_path / "shared.db")
+
+    start_worker(monkeypatch, main.SQLiteStore(path))
+    assert len(main.DATABASE) == 30
+    version = main.DATABASE.store_version()
+
+    for _ in range(3):
+        start_worker(monkeypatch, main.SQLiteStore(path))
+    assert len(main.DATABASE) == 30
+    assert main.DATABASE.store_version() == version
+
+
+def test_snapshot_is_not_loaded_into_a_filled_store(monkeypatch, snapshot):
+    store = main.MemoryStore()
+    monkeypatch.setattr(main, "DATABASE", store)
+    main.save_applicant(main.ApplicantGenerator(22, CLOCK).applicant())
+    monkeypatch.setattr(main, "SNAPSHOT_PATH", snapshot)
+
+    start_worker(monkeypatch, store)
+    assert len(store) == 1